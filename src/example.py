@@ -15,6 +15,8 @@ Usage via cli:
 from __future__ import annotations
 
 import argparse
+import logging
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -26,6 +28,7 @@ from rostering.config import (
 )
 from rostering.generate.make_staff import staff_from_json
 from rostering.main import MinimalProgress, Reporter, default_input_builder
+from rostering.reporting import PrecheckAborted
 from rostering.rules.availability import AvailabilityRule
 from rostering.rules.base import RuleSpec
 from rostering.rules.coverage import CoverageRule
@@ -168,7 +171,12 @@ def run_option(option: int) -> None:
 
 def main() -> None:
     args = parse_args()
-    run_option(args.option)
+    # build_model logs its configuration summary at INFO.
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    try:
+        run_option(args.option)
+    except PrecheckAborted as exc:
+        raise SystemExit(str(exc)) from None
 
 
 if __name__ == "__main__":
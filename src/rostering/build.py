@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from typing import Sequence, Tuple, Type
 
 from ortools.sat.python import cp_model
@@ -10,6 +11,8 @@ from rostering.rules.base import Rule, RuleSpec
 from rostering.rules.objective import ObjectiveBuilder
 from rostering.rules.registry import normalize_rule_specs
 
+logger = logging.getLogger(__name__)
+
 # Type aliases for readability
 ED = Tuple[int, int]  # (employee, day)
 EDH = Tuple[int, int, int]  # (employee, day, hour)
@@ -30,7 +33,10 @@ class BuildContext:
         self.y: dict[ED, cp_model.IntVar] = {}  # optional shift on day d
         self.S: dict[ED, cp_model.IntVar] = {}  # start hour (0..23)
         self.L: dict[ED, cp_model.IntVar] = {}  # length (MIN..MAX)
+        self.E: dict[ED, cp_model.IntVar] = {}  # end hour S + L
         self.x: dict[EDH, cp_model.IntVar] = {}  # worked at hour h
+        self.x_zero: cp_model.IntVar | None = None  # shared 0 for folded slots
+        self.x_by_emp: list[list[cp_model.IntVar]] = []  # non-constant x per employee
         self.z: dict[ED, cp_model.IntVar] = {}  # worked any hour that day
         self.consec_days_worked: dict[ED, cp_model.IntVar] = {}
 
@@ -53,6 +59,10 @@ class BuildContext:
         self.m.AddAssumption(a)
         return a
 
+    def has_rule(self, cls: Type[Rule]) -> bool:
+        """True when an instance of `cls` takes part in this build."""
+        return any(isinstance(r, cls) for r in self._rules)
+
     def core_labels(self, core: Sequence[int]) -> list[str]:
         """Translate literal indices from the solver into readable labels."""
         return [self.ASSUMP_LABEL.get(k, f"lit#{k}") for k in core]
@@ -81,7 +91,8 @@ def build_model(
     specs = normalize_rule_specs(rules)
     ctx._rules = []
     for spec in specs:
-        if not spec.enabled:
+        # Rules that cannot apply under this config are never constructed.
+        if not spec.enabled or not spec.cls.is_enabled(cfg):
             continue
         settings = dict(spec.settings) if spec.settings else {}
         rule = spec.cls(ctx, **settings)
@@ -91,14 +102,16 @@ def build_model(
 
     ctx._rules.sort(key=lambda r: r.order)
 
-    print("SOLVER CONFIGURATION:")
-    print(f"\nN={ctx.cfg.N:,} employees to be assigned shifts")
-    print(
-        f"D={ctx.cfg.DAYS:,} days to be covered, {ctx.cfg.HOURS:,} hours per day = "
-        f"{ctx.cfg.DAYS * ctx.cfg.HOURS:,} slots"
+    logger.info(
+        "Solver configuration: N=%d employees, D=%d days x %d hours = %d slots, "
+        "R=%d rules enabled, P=%d parallel workers",
+        ctx.cfg.N,
+        ctx.cfg.DAYS,
+        ctx.cfg.HOURS,
+        ctx.cfg.DAYS * ctx.cfg.HOURS,
+        len(ctx._rules),
+        ctx.cfg.NUM_PARALLEL_WORKERS,
     )
-    print(f"R={len(ctx._rules):,} rules enabled")
-    print(f"P={ctx.cfg.NUM_PARALLEL_WORKERS:,} parallel computes\n")
 
     # Phase 1: variables
     for r in ctx._rules:
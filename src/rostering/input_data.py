@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional
 
+import numpy as np
+
 from rostering.config import Config
 from rostering.generate.make_staff import (
     StaffGenConfig,
@@ -16,13 +19,65 @@ class InputData:
     staff: list[Staff]
     cfg: Config
     allowed: Optional[list[list[bool]]] = None  # shape: (N, 24)
+    # Holiday day indices relative to cfg.START_DATE, one frozenset per employee.
+    holiday_days: list[frozenset[int]] = field(init=False, repr=False)
+    # Same information as an (N, DAYS) bool mask, clipped to the horizon.
+    holiday_mask: np.ndarray = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
+        self.staff = list(self.staff)
         if self.allowed is None:
             allowed_np = build_allowed_matrix(self.staff, self.cfg)
             self.allowed = allowed_np.astype(bool).tolist()
         else:
             self.allowed = [[bool(val) for val in row] for row in self.allowed or []]
+        base_date = self.cfg.START_DATE.date()
+        self.holiday_days = [
+            frozenset((day - base_date).days for day in s.holidays) for s in self.staff
+        ]
+        days = int(self.cfg.DAYS)
+        self.holiday_mask = np.zeros((len(self.staff), days), dtype=bool)
+        for e, hol in enumerate(self.holiday_days):
+            self.holiday_mask[e, [d for d in hol if 0 <= d < days]] = True
+
+    @cached_property
+    def eligible_by_skill(self) -> dict[str, list[int]]:
+        """
+        Skill name -> sorted employee indices holding it, built in one pass
+        over staff and shared by every rule that reads it.
+        Staff.skills may be a list/set of names or a dict[str, bool] (True == has).
+        """
+        eligible: dict[str, list[int]] = {}
+        for e, st in enumerate(self.staff):
+            sk = st.skills
+            names = [k for k, v in sk.items() if v] if isinstance(sk, dict) else sk
+            for name in dict.fromkeys(names):
+                eligible.setdefault(name, []).append(e)
+        return eligible
+
+    @cached_property
+    def skill_names(self) -> tuple[str, ...]:
+        """Every skill held by some employee, in first-seen order."""
+        return tuple(self.eligible_by_skill)
+
+    @cached_property
+    def has_skill(self) -> np.ndarray:
+        """(N, |skill_names|) uint8 matrix: 1 where employee e holds that skill."""
+        mat = np.zeros((len(self.staff), len(self.skill_names)), dtype=np.uint8)
+        for i, emps in enumerate(self.eligible_by_skill.values()):
+            mat[emps, i] = 1
+        return mat
+
+    @cached_property
+    def skill_masks(self) -> dict[str, int]:
+        """
+        Skill name -> int bitmask of its holders (bit e set iff employee e has it),
+        so membership is one bit test and employee sets combine with & / |.
+        """
+        return {
+            name: sum(1 << e for e in emps)
+            for name, emps in self.eligible_by_skill.items()
+        }
 
 
 def build_input(cfg, DAYS: int, N: int, seed: int = 7) -> InputData:
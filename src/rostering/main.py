@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import logging
+import sys
 from typing import Callable, Sequence, Type
 
 from ortools.sat.python import cp_model
@@ -9,7 +11,7 @@ from rostering.input_data import InputData, build_input
 from rostering.model import RosterModel, SolveResult
 from rostering.output import produce_outputs
 from rostering.progress import MinimalProgress
-from rostering.reporting import Reporter
+from rostering.reporting import PrecheckAborted, Reporter
 from rostering.rules.base import Rule, RuleSpec
 
 InputBuilder = Callable[[Config], InputData]
@@ -113,16 +115,21 @@ def run_solver(
 
 
 def main() -> SolveResult:
-    return run_solver(
-        config=cfg,
-        validate_config=True,
-        input_builder=default_input_builder,
-        reporter=Reporter(cfg),
-        enable_reporting=True,
-        progress_cb=MinimalProgress(
-            cfg.TIME_LIMIT_SEC, cfg.LOG_SOLUTIONS_FREQUENCY_SECONDS
-        ),
-    )
+    # The build summary is logged at INFO; show it on stdout like the report.
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    try:
+        return run_solver(
+            config=cfg,
+            validate_config=True,
+            input_builder=default_input_builder,
+            reporter=Reporter(cfg),
+            enable_reporting=True,
+            progress_cb=MinimalProgress(
+                cfg.TIME_LIMIT_SEC, cfg.LOG_SOLUTIONS_FREQUENCY_SECONDS
+            ),
+        )
+    except PrecheckAborted as exc:
+        raise SystemExit(str(exc)) from None
 
 
 if __name__ == "__main__":
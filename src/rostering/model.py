@@ -20,7 +20,7 @@ from rostering.rules.base import Rule, RuleSpec
 from rostering.solver import solve_model
 
 
-@dataclass
+@dataclass(slots=True)
 class SolveResult:
     """Structured output of a solve run."""
 
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from .adapters import PandasResultAdapter, ResultAdapter
 from .data_models import CoverageMetrics, SlotGap, SlotRequirement
-from .reporter import Reporter
+from .reporter import PrecheckAborted, Reporter
 
 __all__ = [
     "Reporter",
+    "PrecheckAborted",
     "ResultAdapter",
     "PandasResultAdapter",
     "CoverageMetrics",
@@ -52,16 +52,14 @@ def format_model_stats(stats: str | None) -> str | None:
     if total_vars is None:
         return None
 
-    var_line = f"  Variables: total={total_vars:,}"
     details: list[str] = []
     if bools is not None:
         details.append(f"booleans={bools:,}")
     if ints is not None:
         details.append(f"integers={ints:,}")
-    if details:
-        var_line += " (" + ", ".join(details) + ")"
+    detail_str = f" ({', '.join(details)})" if details else ""
 
-    parts = [var_line]
+    parts = [f"  Variables: total={total_vars:,}{detail_str}"]
     if constraint_total:
         parts.append(
             f"  Approximated constraints (linear/max/element): {constraint_total:,}"
@@ -98,19 +96,18 @@ def format_solver_stats(stats: str | None) -> str | None:
         except ValueError:
             wall_fmt = wall_raw
 
-    summary = [
-        f"  Status={status}"
-        + (f", objective={obj_fmt}" if obj_fmt is not None else "")
-        + (f", best_bound={bound_fmt}" if bound_fmt is not None else "")
-    ]
+    status_parts = [f"  Status={status}"]
+    if obj_fmt is not None:
+        status_parts.append(f"objective={obj_fmt}")
+    if bound_fmt is not None:
+        status_parts.append(f"best_bound={bound_fmt}")
+
+    summary = [", ".join(status_parts)]
     if conflicts_fmt:
+        branches = branches_fmt or lines.get("branches") or "n/a"
+        props = props_fmt or lines.get("propagations") or "n/a"
         summary.append(
-            "  Conflicts="
-            + conflicts_fmt
-            + ", branches="
-            + (branches_fmt or lines.get("branches") or "n/a")
-            + ", propagations="
-            + (props_fmt or lines.get("propagations") or "n/a")
+            f"  Conflicts={conflicts_fmt}, branches={branches}, propagations={props}"
         )
     if wall_fmt:
         summary.append(f"  Walltime={wall_fmt}s")
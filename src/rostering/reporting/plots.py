@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any, Sequence
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 from rostering.input_data import InputData
 
@@ -105,10 +106,9 @@ def show_solution_progress(history: Sequence[tuple[float, float, float]]) -> Non
     """
     if not history:
         return
-    solution_idx = list(range(1, len(history) + 1))
-    times = [pt[0] for pt in history]
-    best_vals = [pt[1] for pt in history]
-    bound_vals = [pt[2] for pt in history]
+    hist = np.asarray(history, dtype=float)  # shape (n, 3)
+    times, best_vals, bound_vals = hist[:, 0], hist[:, 1], hist[:, 2]
+    solution_idx = np.arange(1, len(hist) + 1)
 
     fig, ax = plt.subplots(figsize=(7.5, 4), dpi=150)
     ax.set_title("Penalty (objective) history", pad=35)
@@ -129,12 +129,12 @@ def show_solution_progress(history: Sequence[tuple[float, float, float]]) -> Non
     )
     ax.set_xlabel("Solution # (in discovery order)")
     ax.set_ylabel(
-        f"Smallest objective found. Min={min(bound_vals):.1f}", color=penalty_color
+        f"Smallest objective found. Min={bound_vals.min():.1f}", color=penalty_color
     )
     ax.tick_params(axis="y", colors=penalty_color)
     ax.spines["left"].set_color(penalty_color)
     ax.set_xlim(*_expand_limits(solution_idx, axis_padding=0.01))
-    ax.set_ylim(*_expand_limits(best_vals + bound_vals))
+    ax.set_ylim(*_expand_limits(hist[:, 1:]))
     ax.set_xmargin(0.0)
     ax.set_ymargin(0.0)
     ax.spines["top"].set_visible(False)
@@ -152,7 +152,7 @@ def show_solution_progress(history: Sequence[tuple[float, float, float]]) -> Non
         alpha=0.7,
     )
     ax_time.set_ylabel(
-        f"Elapsed time (seconds). Max={max(times):.1f}s", color=time_color
+        f"Elapsed time (seconds). Max={times.max():.1f}s", color=time_color
     )
     ax_time.tick_params(axis="y", colors=time_color)
     ax_time.spines["right"].set_color(time_color)
@@ -182,10 +182,11 @@ def show_solution_progress(history: Sequence[tuple[float, float, float]]) -> Non
 
 
 def _expand_limits(
-    values: Sequence[float], axis_padding: float = 0.05
+    values: Sequence[float] | np.ndarray, axis_padding: float = 0.05
 ) -> tuple[float, float]:
-    lo = min(values)
-    hi = max(values)
+    arr = np.asarray(values, dtype=float)
+    lo = float(arr.min())
+    hi = float(arr.max())
     if lo == hi:
         delta = max(abs(lo), 1.0) * max(axis_padding, 0.05)
         return lo - delta, hi + delta
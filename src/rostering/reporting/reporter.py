@@ -19,6 +19,10 @@ from rostering.reporting.text_report import (
 )
 
 
+class PrecheckAborted(RuntimeError):
+    """Raised when the user declines to continue after an infeasible pre-check."""
+
+
 class Reporter:
     """High-level orchestrator: runs pre-check confirmations and renders reports."""
 
@@ -53,7 +57,7 @@ class Reporter:
         if stage == "model_stats":
             summary = format_model_stats(model_stats)
             if summary:
-                print("\nModel stats summary:\n" + summary)
+                print(f"\nModel stats summary:\n{summary}")
             return
 
         precheck = getattr(model, "precheck", None)
@@ -67,7 +71,7 @@ class Reporter:
                 "Pre-check indicates infeasibility. Continue anyway?"
             )
             if not proceed:
-                raise SystemExit("Stopped by user after infeasible pre-check.")
+                raise PrecheckAborted("Stopped by user after infeasible pre-check.")
 
     def render_text_report(self, res: object, data: object) -> None:
         """Public entry point for callers that want text reporting only."""
@@ -83,7 +87,7 @@ class Reporter:
         """Render textual report (and optional plots) after solving."""
         stats_summary = format_solver_stats(getattr(res, "solver_stats", None))
         if stats_summary:
-            print("\nSolver stats summary:\n" + stats_summary)
+            print(f"\nSolver stats summary:\n{stats_summary}")
 
         status = self.adapter.status_name(res)
         if status not in {"FEASIBLE", "OPTIMAL"}:
@@ -98,13 +98,15 @@ def _fmt_float(x: float | None, nd: int = 2, as_pct: bool = False) -> str:
         return "nan"
 
 
-def _print_hours_histogram(df_emp: pd.DataFrame) -> None:
+def _print_hours_histogram(
+    df_emp: pd.DataFrame, hours: Optional[pd.Series] = None
+) -> None:
     if df_emp.empty or "hours" not in df_emp.columns:
         _log_print("\nHours distribution: (no data)")
         return
-    hours_series = (
-        pd.to_numeric(df_emp["hours"], errors="coerce").dropna().round().astype(int)
-    )
+    if hours is None:
+        hours = pd.to_numeric(df_emp["hours"], errors="coerce")
+    hours_series = hours.dropna().round().astype(int)
     counts = hours_series.value_counts().sort_index()
     _log_print("\nHours distribution — how many staff at each total hour:")
     for h, n in counts.items():
@@ -140,30 +142,34 @@ def render_text_report(
         return
 
     df_emp = adapter.df_emp(res)
+    hours_numeric: Optional[pd.Series] = None
     if not df_emp.empty and "hours" in df_emp.columns:
         _log_print(f"\nPer-employee hours (top {num_print_examples}):")
         _log_print(df_emp.head(num_print_examples).to_string(index=False))
 
-        hrs = pd.to_numeric(df_emp["hours"], errors="coerce").to_numpy(dtype=float)
+        hours_numeric = pd.to_numeric(df_emp["hours"], errors="coerce")
+        hrs = hours_numeric.to_numpy(dtype=float)
         hrs = hrs[~np.isnan(hrs)]
         if hrs.size:
             mean = float(np.mean(hrs))
             std = float(np.std(hrs, ddof=1)) if hrs.size > 1 else float("nan")
-            if hrs.size > 1:
-                p5, p95 = np.percentile(hrs, [5.0, 95.0])
-            else:
-                p5, p95 = float(hrs.min()), float(hrs.max())
             mn, mx = float(np.min(hrs)), float(np.max(hrs))
+            # When every row was already printed above, p5/p95 add nothing, so
+            # only compute them for rosters longer than the printed sample.
+            pct = ""
+            if hrs.size > num_print_examples:
+                p5, p95 = np.percentile(hrs, [5.0, 95.0])
+                pct = f"p5={_fmt_float(p5)} | p95={_fmt_float(p95)} | "
             _log_print(
                 "\nHours distribution across employees: "
                 f"mean={_fmt_float(mean)} | std={_fmt_float(std)} | "
-                f"p5={_fmt_float(p5)} | p95={_fmt_float(p95)} | "
+                f"{pct}"
                 f"min={_fmt_float(mn)} | max={_fmt_float(mx)}"
             )
 
         cap = getattr(cfg, "WEEKLY_MAX_HOURS", None)
         if cap is not None:
-            over = df_emp[pd.to_numeric(df_emp["hours"], errors="coerce") > cap]
+            over = df_emp[hours_numeric > cap]
             if not over.empty:
                 _log_print(f"\n⚠️ Employees over cap {cap}h:")
                 _log_print(over.to_string(index=False))
@@ -172,12 +178,15 @@ def render_text_report(
 
     df_shifts = adapter.df_shifts(res)
     if not df_shifts.empty and {"start_hour", "length_h"}.issubset(df_shifts.columns):
-        df = df_shifts.copy()
         _log_print("\nShift consistency (means across employees):")
-        g = df.groupby("employee_id", sort=False)
-        start_std = g["start_hour"].std(ddof=1).mean()
+        g = df_shifts.groupby("employee_id", sort=False)
         dur_mean = g["length_h"].mean().mean()
-        dur_std = g["length_h"].std(ddof=1).mean()
+        # Per-employee std needs 2+ shifts; skip the groupby-std passes otherwise.
+        if g.size().gt(1).any():
+            start_std = g["start_hour"].std(ddof=1).mean()
+            dur_std = g["length_h"].std(ddof=1).mean()
+        else:
+            start_std = dur_std = float("nan")
         _log_print(
             f"duration mean={_fmt_float(float(dur_mean))} | "
             f"duration std≈{_fmt_float(float(dur_std))} | "
@@ -233,8 +242,12 @@ def render_text_report(
 
     _log_print(f"\nObjective value (overall penalty): {obj:,.0f}")
 
-    top_gaps, df_gaps = compute_slot_gaps(cfg, res, data, adapter, top=5)
-    problem_rows = df_gaps[(df_gaps["deficit"] > 0) | (df_gaps["unattainable"])]
+    # No headcount demand anywhere means no slot can have a deficit.
+    if cov.people_hour_lower_bound > 0:
+        _, df_gaps = compute_slot_gaps(cfg, res, data, adapter, top=5)
+        problem_rows = df_gaps[(df_gaps["deficit"] > 0) | (df_gaps["unattainable"])]
+    else:
+        problem_rows = pd.DataFrame()
     if problem_rows.empty:
         _log_print("\nPer-slot gaps: no deficits against per-slot headcount minima.")
     else:
@@ -255,7 +268,7 @@ def render_text_report(
             .to_string(index=False)
         )
 
-    _print_hours_histogram(df_emp=adapter.df_emp(res))
+    _print_hours_histogram(df_emp=df_emp, hours=hours_numeric)
 
 
 def _print_unsat_core(
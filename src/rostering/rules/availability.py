@@ -1,37 +1,42 @@
-from datetime import date
+from collections.abc import Sequence
+
+import numpy as np
 
 from rostering.rules.base import Rule
 
 
 class AvailabilityRule(Rule):
-    """Define staff availability (all except holidays)"""
+    """
+    Define staff availability (all except holidays).
+
+    Without UNSAT cores, VariablesRule already declared every forbidden slot as
+    the constant 0 and there is nothing left to post. Otherwise this rule is the
+    one place that pins them, behind one AVAIL assumption per employee.
+    """
 
     order = 20
     name = "Availability"
 
     def add_hard(self):
+        if getattr(self.model, "x_zero", None) is not None:
+            return
         C, D, m = self.model.cfg, self.model.data, self.model.m
-        base_date = C.START_DATE.date()
+        forb = forbidden_slot_mask(D.allowed[: C.N], D.holiday_mask[: C.N], C.HOURS)
         for e in range(C.N):
-            s = D.staff[e]
-            forb_days = _dates_to_day_indices(s.holidays, base_date)
-            mask = D.allowed[e]
-            for d in range(C.DAYS):
-                for h in range(C.HOURS):
-                    if (d in forb_days) or (not mask[h]):
-                        ct = m.Add(self.model.x[(e, d, h)] == 0)
-                        self._guard(ct, f"AVAIL[e={e},d={d},h={h}]")
-
-
-def _dates_to_day_indices(days: set[date], base_date: date) -> set[int]:
-    indices: set[int] = set()
-    for day in days:
-        if isinstance(day, int):
-            indices.add(day)
-        elif isinstance(day, date):
-            indices.add(int((day - base_date).days))
-        else:
-            raise TypeError(
-                "Holiday entries must be int day indices or datetime.date objects."
-            )
-    return indices
+            blocked = [
+                self.model.x[(e, d, h)].Not() for d, h in np.argwhere(forb[e]).tolist()
+            ]
+            if not blocked:
+                continue
+            self._guard(m.AddBoolAnd(blocked), f"AVAIL[e={e}]")
+
+
+def forbidden_slot_mask(
+    allowed: Sequence[Sequence[bool]], holiday_mask: np.ndarray, hours: int
+) -> np.ndarray:
+    """
+    (N, DAYS, hours) bool array that is True where an employee may not work:
+    the whole day for a holiday, the whole column for a disallowed hour.
+    """
+    hour_forb = ~np.asarray(allowed, dtype=bool).reshape(len(allowed), -1)[:, :hours]
+    return holiday_mask[:, :, None] | hour_forb[:, None, :]
@@ -6,11 +6,11 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Protocol, Type
 
 if TYPE_CHECKING:
+    from ortools.sat.python import cp_model
+
     from rostering.config import Config
     from rostering.input_data import InputData
 
-from ortools.sat.python import cp_model
-
 
 class BuildCtxProto(Protocol):
     m: cp_model.CpModel
@@ -18,11 +18,14 @@ class BuildCtxProto(Protocol):
     data: InputData
     x: dict[tuple[int, int, int], cp_model.IntVar]
     y: dict[tuple[int, int], cp_model.IntVar]
+    E: dict[tuple[int, int], cp_model.IntVar]
     z: dict[tuple[int, int], cp_model.IntVar]
     consec_days_worked: dict[tuple[int, int], cp_model.IntVar]
 
     def add_assumption(self, label: str) -> cp_model.IntVar: ...
 
+    def has_rule(self, cls: Type[Rule]) -> bool: ...
+
 
 @dataclass
 class RuleSpec:
@@ -41,12 +44,24 @@ class Rule(ABC):
         self.model: BuildCtxProto = model
         self._settings: dict[str, Any] = settings
 
+    @classmethod
+    def is_enabled(cls, cfg: Config) -> bool:
+        """Whether this rule applies under `cfg`; checked before construction."""
+        return True
+
+    def _unsat_core_enabled(self) -> bool:
+        """True when constraints should be guarded by assumption literals.
+
+        Hot loops can resolve this once and skip building labels when False.
+        """
+        cfg = getattr(self.model, "cfg", None)
+        return bool(cfg and getattr(cfg, "ENABLE_UNSAT_CORE", False))
+
     def _assumption_literal(self, label: str | None) -> cp_model.IntVar | None:
         """Return an assumption literal (or None) honoring ENABLE_UNSAT_CORE."""
         if not label:
             return None
-        cfg = getattr(self.model, "cfg", None)
-        if cfg and getattr(cfg, "ENABLE_UNSAT_CORE", False):
+        if self._unsat_core_enabled():
             return self.model.add_assumption(label)
         return None
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from rostering.rules.base import Rule
+from rostering.rules.helpers import cumulative_penalty_table
 
 
 class ConsecutiveDaysRule(Rule):
@@ -35,11 +36,20 @@ class ConsecutiveDaysRule(Rule):
     # ----- shared run-length logic -----
     def declare_vars(self) -> None:
         C, m = self.model.cfg, self.model.m
-        self.model.consec_days_worked = {
-            (e, d): m.NewIntVar(0, C.DAYS, f"run_e{e}_d{d}")
-            for e in range(C.N)
-            for d in range(C.DAYS)
-        }
+        staff = self.model.data.staff
+        # Without UNSAT-core guards a staff cap is just the run var's upper
+        # bound, so no per-day constraint is needed for it in add_hard.
+        capped = not self._unsat_core_enabled()
+        self.model.consec_days_worked = {}
+        for e in range(C.N):
+            ub = C.DAYS
+            limit_val = staff[e].max_consec_days
+            if capped and limit_val is not None and limit_val > 0:
+                ub = min(ub, limit_val)
+            for d in range(C.DAYS):
+                self.model.consec_days_worked[(e, d)] = m.NewIntVar(
+                    0, ub, f"run_e{e}_d{d}"
+                )
 
     def add_hard(self) -> None:
         C, data, m = self.model.cfg, self.model.data, self.model.m
@@ -47,44 +57,42 @@ class ConsecutiveDaysRule(Rule):
         if not consec_days_worked:
             return
 
-        for e in range(C.N):
-            # Base case for day 0.
-            ct = m.Add(consec_days_worked[(e, 0)] == self.model.z[(e, 0)])
-            self._guard(ct, f"consec_days_worked-BASE[e={e}]")
-
-            for d in range(1, C.DAYS):
-                prev = consec_days_worked[(e, d - 1)]
-                cur = consec_days_worked[(e, d)]
+        # Resolve the UNSAT-core switch once; labels are only built when used.
+        guarded = self._unsat_core_enabled()
 
-                ct = m.Add(cur <= prev + 1)
-                self._guard(ct, f"consec_days_worked-UP[e={e},d={d}]")
-
-                ct = m.Add(cur <= C.DAYS * self.model.z[(e, d)])
-                self._guard(ct, f"consec_days_worked-Z[e={e},d={d}]")
-
-                ct = m.Add(cur >= prev + 1 - C.DAYS * (1 - self.model.z[(e, d)]))
-                self._guard(ct, f"consec_days_worked-DOWN[e={e},d={d}]")
-
-            # Hard max consecutive-day enforcement per staff member.
-            if e < len(data.staff):
-                limit = getattr(data.staff[e], "max_consec_days", None)
-            else:
-                limit = None
-
-            if limit is None:
-                continue
+        def guard(ct, label: str) -> None:
+            ct.OnlyEnforceIf(self.model.add_assumption(label))
 
-            try:
-                limit_val = int(limit)
-            except (TypeError, ValueError):
-                continue
-
-            if limit_val <= 0:
+        run, z, days = consec_days_worked, self.model.z, C.DAYS
+        for e in range(C.N):
+            # Base case for day 0.
+            ct = m.Add(run[(e, 0)] == z[(e, 0)])
+            if guarded:
+                guard(ct, f"consec_days_worked-BASE[e={e}]")
+
+            # Recurrence run[d] = z[d] * (run[d-1] + 1), channelled on z as two
+            # half-reified equalities instead of three big-M inequalities.
+            # (A product constraint cannot carry the UNSAT-core enforcement literal.)
+            prev = run[(e, 0)]
+            for d in range(1, days):
+                cur, z_ed = run[(e, d)], z[(e, d)]
+                ct_on = m.Add(cur == prev + 1).OnlyEnforceIf(z_ed)
+                ct_off = m.Add(cur == 0).OnlyEnforceIf(z_ed.Not())
+                if guarded:
+                    guard(ct_on, f"consec_days_worked-ON[e={e},d={d}]")
+                    guard(ct_off, f"consec_days_worked-OFF[e={e},d={d}]")
+                prev = cur
+
+            # Hard max consecutive-day enforcement per staff member. Unguarded
+            # caps already bound the run vars (see declare_vars).
+            limit_val = data.staff[e].max_consec_days
+            if not guarded or limit_val is None or limit_val <= 0:
                 continue
 
-            for d in range(C.DAYS):
-                ct = m.Add(consec_days_worked[(e, d)] <= limit_val)
-                self._guard(ct, f"MAX-CONSEC[e={e},d={d},limit={limit_val}]")
+            for d in range(days):
+                ct = m.Add(run[(e, d)] <= limit_val)
+                if guarded:
+                    guard(ct, f"MAX-CONSEC[e={e},d={d},limit={limit_val}]")
 
     def contribute_objective(self):
         consec_days_worked = getattr(self.model, "consec_days_worked", None)
@@ -92,51 +100,31 @@ class ConsecutiveDaysRule(Rule):
             return []
 
         C, m = self.model.cfg, self.model.m
-        staff = list(getattr(self.model.data, "staff", []) or [])
+        staff = self.model.data.staff
         max_gap = min(self.max_gap, C.DAYS)
-        penalty_table = [0]
-        cumulative = 0
-        for k in range(1, max_gap + 1):
-            cumulative += int(round(self.scaler * (self.base**k)))
-            penalty_table.append(cumulative)
+        penalty_table = cumulative_penalty_table(self.scaler, self.base, max_gap)
         max_penalty = penalty_table[-1]
 
-        cap_const = m.NewIntVar(max_gap, max_gap, "consec_cap_const")
-
+        # Penalty indexed directly by run length 0..DAYS: zero up to the
+        # threshold, then the cumulative table, plateauing once the run reaches
+        # max_gap. One AddElement per (e, d) replaces the cap/excess chain.
+        threshold = self.consec_days_before_penality
+        run_table = [
+            penalty_table[max(0, min(run, max_gap) - threshold)]
+            for run in range(C.DAYS + 1)
+        ]
+
+        # Runs starting this late can never exceed the threshold in-horizon.
+        penalised_days = range(max(0, C.DAYS - threshold))
+        run = consec_days_worked
         terms = []
         for e in range(C.N):
-            limit_val = None
-            if e < len(staff):
-                limit = getattr(staff[e], "max_consec_days", None)
-                if limit is not None:
-                    try:
-                        limit_val = int(limit)
-                    except (TypeError, ValueError):
-                        limit_val = None
-            if limit_val is not None and self.consec_days_before_penality >= limit_val:
+            limit_val = staff[e].max_consec_days
+            if limit_val is not None and threshold >= limit_val:
                 continue
 
-            for d in range(C.DAYS):
-                remaining_days = C.DAYS - d
-                if remaining_days <= self.consec_days_before_penality:
-                    continue
-                capped_run = m.NewIntVar(0, max_gap, f"consec_cap_e{e}_d{d}")
-                m.AddMinEquality(capped_run, [consec_days_worked[(e, d)], cap_const])
-
-                excess = m.NewIntVar(0, max_gap, f"consec_excess_e{e}_d{d}")
-                over = m.NewBoolVar(f"consec_over_e{e}_d{d}")
-                m.Add(capped_run >= self.consec_days_before_penality + 1).OnlyEnforceIf(
-                    over
-                )
-                m.Add(capped_run <= self.consec_days_before_penality).OnlyEnforceIf(
-                    over.Not()
-                )
-                m.Add(
-                    excess == capped_run - self.consec_days_before_penality
-                ).OnlyEnforceIf(over)
-                m.Add(excess == 0).OnlyEnforceIf(over.Not())
-
+            for d in penalised_days:
                 penalty = m.NewIntVar(0, max_penalty, f"consec_penalty_e{e}_d{d}")
-                m.AddElement(excess, penalty_table, penalty)
+                m.AddElement(run[(e, d)], run_table, penalty)
                 terms.append(penalty)
         return terms
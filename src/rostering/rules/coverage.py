@@ -1,59 +1,23 @@
 # src/rostering/rules/coverage.py
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import Any, Callable, Set
+from collections import defaultdict
+from typing import Any, Set
+
+import numpy as np
+from ortools.sat.python import cp_model
 
 from rostering.config import Config
 from rostering.input_data import InputData
 from rostering.rules.base import Rule
 
 
-def _collect_required_skills(C: Config) -> Set[str]:
-    """Gather every skill token that appears anywhere in SKILL_MIN / SKILL_MAX."""
-    skills: Set[str] = set()
-    skill_min = getattr(C, "SKILL_MIN", None)
-    if skill_min is not None:
-        for row in skill_min:
-            for slot in row:
-                skills.update(slot.keys())
-    skill_max = getattr(C, "SKILL_MAX", None)
-    if skill_max is not None:
-        for row in skill_max:
-            for slot in row:
-                skills.update(slot.keys())
-    return skills
-
-
-def _make_predicate_resolver(D: InputData) -> Callable[[str], Callable[[int], bool]]:
-    """
-    Return a resolver that, for a given skill name, produces a predicate
-    employee_index -> bool using Staff.skills (set/list) or dict[str,bool] (True==has).
-    """
-    staff = list(getattr(D, "staff", []) or [])
-
-    @lru_cache(maxsize=None)
-    def _resolver(skill_name: str) -> Callable[[int], bool]:
-        def _pred(e: int) -> bool:
-            if not (0 <= e < len(staff)):
-                return False
-            sk = getattr(staff[e], "skills", None)
-            if isinstance(sk, dict):
-                return bool(sk.get(skill_name, False))
-            try:
-                return skill_name in set(sk or [])
-            except TypeError:
-                return bool(
-                    getattr(
-                        staff[e],
-                        f"skill{skill_name}",
-                        getattr(staff[e], skill_name, False),
-                    )
-                )
-
-        return _pred
-
-    return _resolver
+def _bitmask(flags) -> int:
+    """Fold a bool sequence into an int with bit e set where flags[e] is true."""
+    mask = 0
+    for e in np.flatnonzero(flags).tolist():
+        mask |= 1 << e
+    return mask
 
 
 class CoverageRule(Rule):
@@ -65,7 +29,8 @@ class CoverageRule(Rule):
         - ∑_e a[e,d,h,s] ≤ SKILL_MAX[d][h][s]   (if provided)
         - ∑_s a[e,d,h,s] ≤ x[e,d,h]             (each employee covers ≤1 skill per hour)
       Eligibility:
-        - a[e,d,h,s] = 0 if employee lacks skill s, hour disallowed by mask, or day is a holiday.
+        - a[e,d,h,s] is not created if employee lacks skill s, hour disallowed by mask,
+          or day is a holiday.
     This implies the people-hour lower bound and prevents “unassigned shifts”
     whenever minima are feasible.
     """
@@ -73,30 +38,61 @@ class CoverageRule(Rule):
     order = 60
     name = "CoverageMinima"
 
+    def __init__(self, model, **settings):
+        super().__init__(model, **settings)
+        self._slot_skills: list[list[frozenset[str]]] | None = None
+        self._slot_min: list[list[dict[str, int]]] = []
+        self._slot_max: list[list[dict[str, int]]] = []
+        self._all_skills: Set[str] = set()
+
+    def _precompute_grids(self) -> None:
+        """
+        Walk SKILL_MIN / SKILL_MAX once and cache, per (d,h), the min and max
+        dicts and the skills with any demand, plus the union of all skills.
+        """
+        if self._slot_skills is not None:
+            return
+        C = self.model.cfg
+        DAYS, HOURS = int(getattr(C, "DAYS", 0)), int(getattr(C, "HOURS", 0))
+        skill_min = getattr(C, "SKILL_MIN", None)
+        skill_max = getattr(C, "SKILL_MAX", None)
+
+        slot_skills: list[list[frozenset[str]]] = []
+        for d in range(DAYS):
+            min_row = skill_min[d] if skill_min is not None else None
+            max_row = skill_max[d] if skill_max is not None else None
+            skills_row, mins, maxs = [], [], []
+            for h in range(HOURS):
+                slot_min = (min_row[h] if min_row is not None else None) or {}
+                slot_max = (max_row[h] if max_row is not None else None) or {}
+                mins.append(slot_min)
+                maxs.append(slot_max)
+                skills_row.append(frozenset(slot_min) | frozenset(slot_max))
+            slot_skills.append(skills_row)
+            self._slot_min.append(mins)
+            self._slot_max.append(maxs)
+        self._all_skills = set().union(*(sk for row in slot_skills for sk in row))
+        self._slot_skills = slot_skills
+
     def report_descriptors(self) -> list[dict[str, Any]]:
         """Keep the existing descriptor for your reporter."""
         C: Config = self.model.cfg
         D: InputData = self.model.data
 
-        skills = sorted(_collect_required_skills(C))
-        resolve = _make_predicate_resolver(D)
-
+        self._precompute_grids()
+        skills = sorted(self._all_skills)
         n_emp = int(getattr(C, "N", 0))
+        has_skill = D.has_skill[:n_emp]
+        col = {name: i for i, name in enumerate(D.skill_names)}
         eligible: dict[str, list[int]] = {
-            s: [e for e in range(n_emp) if resolve(s)(e)] for s in skills
+            s: np.flatnonzero(has_skill[:, col[s]]).tolist() if s in col else []
+            for s in skills
         }
 
-        skill_min = getattr(C, "SKILL_MIN", None)
-        skill_max = getattr(C, "SKILL_MAX", None)
-
-        def get_min(d: int, h: int) -> dict[str, int]:
-            return dict(skill_min[d][h]) if skill_min is not None else {}
-
-        def get_max(d: int, h: int) -> dict[str, int]:
-            return dict(skill_max[d][h]) if skill_max is not None else {}
+        slot_min, slot_max = self._slot_min, self._slot_max
 
         def compute_requirements(d: int, h: int) -> dict[str, Any]:
-            return {"min": get_min(d, h), "max": get_max(d, h)}
+            return {"min": dict(slot_min[d][h]), "max": dict(slot_max[d][h])}
 
         return [
             {
@@ -114,100 +110,87 @@ class CoverageRule(Rule):
     def declare_vars(self):
         """
         Create a[e,d,h,s] BoolVars only where there is any min/max demand for skill s
-        (keeps the model smaller than creating the full dense grid).
+        and employee e is eligible for it at (d,h): holds the skill, the hour is
+        allowed and the day is not a holiday. Ineligible tuples have no key in
+        `a`, so they simply contribute nothing to the coverage sums.
         """
-        C, m = self.model.cfg, self.model.m
+        C, D, m = self.model.cfg, self.model.data, self.model.m
         DAYS, HOURS = int(C.DAYS), int(C.HOURS)
 
-        raw_skill_min = getattr(C, "SKILL_MIN", None)
-        raw_skill_max = getattr(C, "SKILL_MAX", None)
-        skill_min = raw_skill_min or [[{} for _ in range(HOURS)] for _ in range(DAYS)]
-        skill_max = raw_skill_max or [[{} for _ in range(HOURS)] for _ in range(DAYS)]
+        self._precompute_grids()
+        slot_skills_grid = self._slot_skills
+
+        # Employee sets as int bitmasks (bit e == employee e), so a slot's
+        # eligible employees for a skill are two ANDs plus a bit scan.
+        n = int(C.N)
+        skill_mask = D.skill_masks
+        allowed = np.asarray(D.allowed[:n], dtype=bool).reshape(n, -1)
+        allowed_mask = [_bitmask(allowed[:, h]) for h in range(HOURS)]
+        not_holiday = ~D.holiday_mask[:n]
+        # Staff beyond C.N are dropped here, once per day.
+        not_holiday_mask = [_bitmask(not_holiday[:, d]) for d in range(DAYS)]
 
         self.model.a = {}  # (e,d,h,s) -> BoolVar
+        # Same vars grouped per slot, so add_hard can hand whole lists to CP-SAT.
+        self.model.a_by_slot = defaultdict(list)  # (d,h,s) -> [BoolVar]
 
         for d in range(DAYS):
+            day_free = not_holiday_mask[d]
             for h in range(HOURS):
-                # build the set of skills that matter in this slot (min or max present)
-                slot_skills = set(skill_min[d][h].keys())
-                if raw_skill_max is not None:
-                    slot_skills = slot_skills.union(set(skill_max[d][h].keys()))
+                # skills that matter in this slot (min or max present)
+                slot_skills = slot_skills_grid[d][h]
                 if not slot_skills:
                     continue
+                slot_free = day_free & allowed_mask[h]
                 for s in slot_skills:
-                    for e in range(int(C.N)):
-                        self.model.a[(e, d, h, s)] = m.NewBoolVar(
-                            f"a_e{e}_d{d}_h{h}_s{s}"
-                        )
+                    mask = skill_mask.get(s, 0) & slot_free
+                    while mask:
+                        low = mask & -mask
+                        e = low.bit_length() - 1
+                        mask ^= low
+                        var = m.NewBoolVar(f"a_e{e}_d{d}_h{h}_s{s}")
+                        self.model.a[(e, d, h, s)] = var
+                        self.model.a_by_slot[(d, h, s)].append(var)
 
     # ---------- NEW: hard constraints ----------
     def add_hard(self):
-        C, D, m = self.model.cfg, self.model.data, self.model.m
+        C, m = self.model.cfg, self.model.m
         DAYS, HOURS = int(C.DAYS), int(C.HOURS)
 
         # Required data from other rules:
         # - x[(e,d,h)] must exist (hour-work BoolVar)
         x = self.model.x
+        a_by_slot = self.model.a_by_slot
 
-        # Helpers
-        resolve_skill = _make_predicate_resolver(D)
-        allowed = getattr(
-            D, "allowed", None
-        )  # shape [N][HOURS] booleans per employee/hour
-
-        skill_min = getattr(C, "SKILL_MIN", None) or [
-            [{} for _ in range(HOURS)] for _ in range(DAYS)
-        ]
-        skill_max = getattr(C, "SKILL_MAX", None)
-        has_skill_max = skill_max is not None
-        if not has_skill_max:
-            skill_max = [[{} for _ in range(HOURS)] for _ in range(DAYS)]
+        self._precompute_grids()
+        skill_min, skill_max = self._slot_min, self._slot_max
 
         # 1) Link each skill assignment to being at work that hour
         for (e, d, h, s), var in self.model.a.items():
             m.Add(var <= x[(e, d, h)])
 
-        # 2) Eligibility pruning: a[e,d,h,s] = 0 if employee cannot cover s at (d,h)
-        for (e, d, h, s), var in self.model.a.items():
-            has_skill = resolve_skill(s)(e)
-            hour_ok = bool(allowed[e][h]) if allowed is not None else True
-            is_holiday = d in set(getattr(D.staff[e], "holidays", []))
-            if not (has_skill and hour_ok and not is_holiday):
-                m.Add(var == 0)
-
-        # 3) Hard minima / maxima per skill
+        # 2) Hard minima / maxima per skill
         for d in range(DAYS):
             for h in range(HOURS):
-                slot_min = skill_min[d][h] or {}
-                slot_max = skill_max[d][h] or {}
+                slot_min = skill_min[d][h]
+                slot_max = skill_max[d][h]
 
                 # Min: ∑_e a ≥ SKILL_MIN[d][h][s]
                 for s, req in slot_min.items():
                     req = int(req)
                     if req > 0:
-                        a_e = [
-                            self.model.a[(e, d, h, s)]
-                            for e in range(int(C.N))
-                            if (e, d, h, s) in self.model.a
-                        ]
-                        if (
-                            a_e
-                        ):  # if there are no vars, it's infeasible; let solver detect
-                            lhs = sum(a_e)
-                            ct = m.Add(lhs >= req)
-                            self._guard(ct, f"COV-MIN[s={s},d={d},h={h}]")
-
-                if has_skill_max:
-                    # Max: ∑_e a ≤ SKILL_MAX[d][h][s]
-                    for s, cap in slot_max.items():
-                        cap = int(cap)
-                        if cap >= 0:
-                            a_e = [
-                                self.model.a[(e, d, h, s)]
-                                for e in range(int(C.N))
-                                if (e, d, h, s) in self.model.a
-                            ]
-                            if a_e:
-                                lhs = sum(a_e)
-                                ct = m.Add(lhs <= cap)
-                                self._guard(ct, f"COV-MAX[s={s},d={d},h={h}]")
+                        a_e = a_by_slot.get((d, h, s), ())
+                        # With no eligible vars the sum is 0 and the constraint
+                        # is infeasible; post it anyway so the solver (and the
+                        # UNSAT core) reports the slot.
+                        ct = m.Add(cp_model.LinearExpr.Sum(a_e) >= req)
+                        self._guard(ct, f"COV-MIN[s={s},d={d},h={h}]")
+
+                # Max: ∑_e a ≤ SKILL_MAX[d][h][s]
+                for s, cap in slot_max.items():
+                    cap = int(cap)
+                    if cap >= 0:
+                        a_e = a_by_slot.get((d, h, s), ())
+                        if a_e:
+                            ct = m.Add(cp_model.LinearExpr.Sum(a_e) <= cap)
+                            self._guard(ct, f"COV-MAX[s={s},d={d},h={h}]")
@@ -1,3 +1,4 @@
+from rostering.rules.availability import AvailabilityRule, forbidden_slot_mask
 from rostering.rules.base import Rule
 
 
@@ -9,6 +10,7 @@ class VariablesRule(Rule):
 
     def declare_vars(self):
         C = self.model.cfg
+        D = self.model.data
         m = self.model.m
         # Intervals: one optional shift per employee/day
         self.model.y = {
@@ -26,13 +28,38 @@ class VariablesRule(Rule):
             for e in range(C.N)
             for d in range(C.DAYS)
         }
-        # Hourly realized assignment
-        self.model.x = {
-            (e, d, h): m.NewBoolVar(f"x_e{e}_d{d}_h{h}")
-            for e in range(C.N)
-            for d in range(C.DAYS)
-            for h in range(C.HOURS)
-        }
+        # Shift end S + L (may run past midnight), so reified bounds on the
+        # end are single-variable literals rather than two-term sums.
+        self.model.E = {}
+        for (e, d), start in self.model.S.items():
+            end = m.NewIntVar(
+                C.MIN_SHIFT_HOURS, C.HOURS - 1 + C.MAX_SHIFT_HOURS, f"E_e{e}_d{d}"
+            )
+            m.Add(end == start + self.model.L[(e, d)])
+            self.model.E[(e, d)] = end
+        # Hourly realized assignment. Without UNSAT cores, slots an employee can
+        # never work (holiday or disallowed hour) share one constant 0 instead
+        # of a fresh BoolVar, so nothing has to pin them later. With cores they
+        # stay real vars that AvailabilityRule pins behind AVAIL assumptions,
+        # and without AvailabilityRule they are not blocked at all.
+        fold = not self._unsat_core_enabled() and self.model.has_rule(AvailabilityRule)
+        zero = self.model.x_zero = m.NewConstant(0) if fold else None
+        self.model.x = {}
+        # Per-employee list of the real (non-constant) x vars, for total-hour sums.
+        self.model.x_by_emp = [[] for _ in range(C.N)]
+        forb_all = forbidden_slot_mask(
+            D.allowed[: C.N], D.holiday_mask[: C.N], C.HOURS
+        ).tolist()
+        for e, forb in enumerate(forb_all):
+            x_e = self.model.x_by_emp[e]
+            for d, row in enumerate(forb):
+                for h, blocked in enumerate(row):
+                    if blocked and zero is not None:
+                        var = zero
+                    else:
+                        var = m.NewBoolVar(f"x_e{e}_d{d}_h{h}")
+                        x_e.append(var)
+                    self.model.x[(e, d, h)] = var
         # Day on/off
         self.model.z = {
             (e, d): m.NewBoolVar(f"z_e{e}_d{d}")
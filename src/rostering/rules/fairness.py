@@ -1,7 +1,16 @@
+import logging
+
 import numpy as np
+from ortools.sat.python import cp_model
 
 from rostering.rules.base import Rule
-from rostering.rules.helpers import ensure_total_hours
+from rostering.rules.helpers import (
+    cumulative_penalty_table,
+    ensure_total_hours,
+    linear_step,
+)
+
+logger = logging.getLogger(__name__)
 
 
 def _required_hours_lower_bound(C) -> int:
@@ -12,11 +21,12 @@ def _required_hours_lower_bound(C) -> int:
     """
     if getattr(C, "SKILL_MIN", None) is None:
         return 0
+    days, hours = int(getattr(C, "DAYS", 0)), int(getattr(C, "HOURS", 0))
     total = 0
-    for d in range(int(getattr(C, "DAYS", 0))):
-        for h in range(int(getattr(C, "HOURS", 0))):
-            slot_min = dict(C.SKILL_MIN[d][h])
-            total += int(max(slot_min.values())) if slot_min else 0
+    for row in C.SKILL_MIN[:days]:
+        for slot_min in row[:hours]:
+            if slot_min:
+                total += int(max(slot_min.values()))
     return total
 
 
@@ -35,6 +45,9 @@ class FairnessRule(Rule):
       • max_deviation_hours (int):
           clamps the AddElement lookup. Example: max_deviation_hours=6 limits the
           cumulative term to Σ_{k=1..6} scale * baseᵏ; hour 7+ reuses the hour-6 cost.
+      • asymmetric (bool, default False):
+          penalise only hours above the equal-share target. Example: target=37.5h,
+          T_e=30h costs nothing, T_e=41h counts as 41 - 38 = 3h of deviation.
 
     Band shortfall settings (optional):
       • band_shortfall_base / band_shortfall_scale / band_shortfall_max_gap:
@@ -53,6 +66,22 @@ class FairnessRule(Rule):
 
     def __init__(self, model, **settings):
         super().__init__(model, **settings)
+        self._bands: np.ndarray | None = None
+        self._band_members: np.ndarray | None = None
+
+    def bands(self) -> np.ndarray:
+        """Staff band levels as an int64 array of length N (cached)."""
+        if self._bands is None:
+            staff = self.model.data.staff[: self.model.cfg.N]
+            self._bands = np.array([s.band or 1 for s in staff], dtype=np.int64)
+        return self._bands
+
+    def band_members(self) -> np.ndarray:
+        """Sorted indices of employees at or above band_shortfall_threshold (cached)."""
+        if self._band_members is None:
+            threshold = int(self.setting("band_shortfall_threshold", 1))
+            self._band_members = np.flatnonzero(self.bands() >= threshold)
+        return self._band_members
 
     def contribute_objective(self):
         # If the rule is disabled or the roster is empty, there is nothing to add.
@@ -60,7 +89,6 @@ class FairnessRule(Rule):
             return []
 
         C, M = self.model.cfg, self.model.m
-        staff = list(getattr(self.model.data, "staff", []) or [])
         if C.N <= 0:
             return []
 
@@ -87,12 +115,17 @@ class FairnessRule(Rule):
         DEV_CAP = int(self.setting("max_deviation_hours", min(horizon_ub, 8)))
         BASE = float(self.setting("base", 1.2))  # > 1.0
         SCALE = float(self.setting("scale", 1.0))  # positive number
-
-        print(
-            f"Fairness: Base={BASE}, Scale={SCALE}, Max Dev={DEV_CAP}\n"
-            f"Fairness penalty formula: Scale * ( Base ** Hours)\n"
-            f"Max fairness penalty: Scale * (Base ** Max Dev) = {SCALE} * ({BASE} ** {DEV_CAP}) == {SCALE * (BASE**DEV_CAP):,.3f}"
-        )
+        ASYMMETRIC = bool(self.setting("asymmetric", False))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Fairness: Base=%s, Scale=%s, Max Dev=%s; "
+                "penalty = Scale * (Base ** Hours), max %.3f",
+                BASE,
+                SCALE,
+                DEV_CAP,
+                SCALE * (BASE**DEV_CAP),
+            )
 
         assert (
             BASE > 1.0
@@ -101,40 +134,46 @@ class FairnessRule(Rule):
 
         # Precompute cumulative penalty table so we can look up the total weight
         # with a single AddElement instead of spawning many Boolean tiers.
-        penalty_table = [0]
-        cumulative = 0
-        for k in range(1, DEV_CAP + 1):
-            cumulative += int(round(SCALE * (BASE**k)))
-            penalty_table.append(cumulative)
+        penalty_table = cumulative_penalty_table(SCALE, BASE, DEV_CAP)
         max_penalty = penalty_table[-1]
+        # A linear table (one constant step) is a plain coefficient on the
+        # capped deviation, with no element constraint.
+        tier_step = linear_step(penalty_table)
+        # scale=0, max_deviation_hours=0 or tiers that all round to 0 leave an
+        # all-zero table; skip the tier vars entirely then.
+        tiers_enabled = tier_step != 0
 
         get_total = ensure_total_hours(self, horizon_ub)
-        total_sum = getattr(self.model, "_total_hours_sum", None)
-        if total_sum is None:
-            total_sum = M.NewIntVar(0, horizon_ub * C.N, "total_hours_sum")
-            M.Add(total_sum == sum(get_total(e) for e in range(C.N)))
-            self.model._total_hours_sum = total_sum
+        totals = [get_total(e) for e in range(C.N)]
 
         # Optional 'band shortfall' extension. When enabled it layers an extra penalty
         # on top of fairness for higher bands who fall short of the fleet average.
         band_base = float(self.setting("band_shortfall_base", 1.25))
         band_scale = float(self.setting("band_shortfall_scale", 0.5))
         band_max_gap = int(self.setting("band_shortfall_max_gap", 4))
-        band_threshold = int(self.setting("band_shortfall_threshold", 1))
         band_enabled = band_scale > 0 and band_base > 1.0 and band_max_gap > 0
+        band_members = np.empty(0, dtype=np.int64)
         if band_enabled:
-            band_table = [0]
-            cumulative = 0
-            for k in range(1, band_max_gap + 1):
-                cumulative += int(round(band_scale * (band_base**k)))
-                band_table.append(cumulative)
-            band_cap_const = M.NewIntVar(
-                band_max_gap, band_max_gap, "band_short_cap_const"
-            )
+            # Only bands at or above the threshold receive the extra penalty. The
+            # curve does not depend on the band level, so every member shares the
+            # one table (and its max) built below.
+            band_members = self.band_members()
+            band_table = cumulative_penalty_table(band_scale, band_base, band_max_gap)
+            band_max_penalty = band_table[-1]
+            band_step = linear_step(band_table)
+            if band_step == 0:
+                band_members = np.empty(0, dtype=np.int64)
+            # The cap only binds when a shortfall can exceed band_max_gap.
+            band_needs_cap = horizon_ub > band_max_gap
+            if band_needs_cap:
+                band_cap_const = M.NewConstant(band_max_gap)
 
         terms = []
 
-        cap_constant = M.NewIntVar(DEV_CAP, DEV_CAP, "fair_dev_cap_const")
+        # CP-SAT caches constants, so this shares one index with any other
+        # rule that uses the same value.
+        if tiers_enabled:
+            cap_constant = M.NewConstant(DEV_CAP)
 
         for e in range(C.N):
             # ------------------------------------------------------------------
@@ -147,7 +186,7 @@ class FairnessRule(Rule):
             #    when the employee covers 60 hours, effectively dodging fairness
             #    penalties altogether.
             # ------------------------------------------------------------------
-            T_e = get_total(e)
+            T_e = totals[e]
 
             # ------------------------------------------------------------------
             # 5) Linearise |T_e - target| by bounding it between floor/ceil.
@@ -157,10 +196,15 @@ class FairnessRule(Rule):
             #    With both inequalities active, dev mirrors |T_e - 37.5| while
             #    keeping everything in integer arithmetic (CP-SAT cannot use
             #    floating-point constants directly in constraints).
+            #    In asymmetric mode only the over-hours half-plane is posted,
+            #    measured from t_ceil so reaching the target is free.
             # ------------------------------------------------------------------
             dev = M.NewIntVar(0, horizon_ub, f"dev_e{e}")
-            M.Add(dev >= T_e - t_floor)
-            M.Add(dev >= t_ceil - T_e)
+            if ASYMMETRIC:
+                M.Add(dev >= T_e - t_ceil)
+            else:
+                M.Add(dev >= T_e - t_floor)
+                M.Add(dev >= t_ceil - T_e)
 
             terms.append(dev)
 
@@ -172,29 +216,38 @@ class FairnessRule(Rule):
             #    Instead of four BoolVars, we clamp dev to 8 and feed it
             #    directly into AddElement, which returns the cumulative weight.
             # ------------------------------------------------------------------
+            if not tiers_enabled:
+                continue
             capped_dev = M.NewIntVar(0, DEV_CAP, f"dev_cap_e{e}")
             M.AddMinEquality(capped_dev, [dev, cap_constant])
 
+            if tier_step is not None:
+                terms.append(tier_step * capped_dev)
+                continue
             penalty = M.NewIntVar(0, max_penalty, f"fair_penalty_e{e}")
             M.AddElement(capped_dev, penalty_table, penalty)
             terms.append(penalty)
 
-            if band_enabled:
-                # Translate band level into a multiplier exponent. Only bands above
-                # the threshold receive the extra penalty.
-                band_level = (
-                    getattr(staff[e], "band", 1) if e < len(staff) else 1
-                ) or 1
-                if band_level >= band_threshold:
-                    # shortfall captures how far this employee is below the fleet average.
-                    shortfall = M.NewIntVar(0, horizon_ub, f"band_shortfall_e{e}")
-                    gap_expr = total_sum - C.N * T_e
-                    M.Add(C.N * shortfall >= gap_expr)
-                    # Clamp the shortfall to the configured max gap.
-                    capped_shortfall = M.NewIntVar(0, band_max_gap, f"band_cap_e{e}")
-                    M.AddMinEquality(capped_shortfall, [shortfall, band_cap_const])
-                    band_penalty = M.NewIntVar(0, band_table[-1], f"band_penalty_e{e}")
-                    M.AddElement(capped_shortfall, band_table, band_penalty)
-                    terms.append(band_penalty)
+        for e in band_members.tolist():
+            # shortfall captures how far this employee is below the fleet average.
+            shortfall = M.NewIntVar(0, horizon_ub, f"band_shortfall_e{e}")
+            # Σ_j T_j - N*T_e as one weighted sum, so there is no fleet-total
+            # variable for presolve to eliminate.
+            coeffs = [1] * C.N
+            coeffs[e] = 1 - C.N
+            gap_expr = cp_model.LinearExpr.WeightedSum(totals, coeffs)
+            M.Add(C.N * shortfall >= gap_expr)
+            # Clamp the shortfall to the configured max gap.
+            if band_needs_cap:
+                capped_shortfall = M.NewIntVar(0, band_max_gap, f"band_cap_e{e}")
+                M.AddMinEquality(capped_shortfall, [shortfall, band_cap_const])
+            else:
+                capped_shortfall = shortfall
+            if band_step is not None:
+                terms.append(band_step * capped_shortfall)
+                continue
+            band_penalty = M.NewIntVar(0, band_max_penalty, f"band_penalty_e{e}")
+            M.AddElement(capped_shortfall, band_table, band_penalty)
+            terms.append(band_penalty)
 
         return terms
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Callable
+from collections.abc import Callable
+from functools import cache
+from itertools import accumulate, pairwise
 
 from ortools.sat.python import cp_model
 
@@ -8,25 +10,56 @@ from ortools.sat.python import cp_model
 def ensure_total_hours(rule, horizon_ub: int) -> Callable[[int], cp_model.IntVar]:
     """Return accessor that reuses per-employee total-hour IntVars."""
 
-    cache: dict[int, cp_model.IntVar] | None = getattr(
+    totals: dict[int, cp_model.IntVar] | None = getattr(
         rule.model, "_total_hours_cache", None
     )
-    if cache is None:
-        cache = {}
-        rule.model._total_hours_cache = cache
+    if totals is None:
+        totals = {}
+        rule.model._total_hours_cache = totals
+        rule.model._total_hours_ub = {}
+    ubs: dict[int, int] = rule.model._total_hours_ub
 
     def _getter(e: int) -> cp_model.IntVar:
-        if e not in cache:
+        if e not in totals:
             total = rule.model.m.NewIntVar(0, horizon_ub, f"total_hours_e{e}")
-            rule.model.m.Add(
-                total
-                == sum(
+            x_by_emp = getattr(rule.model, "x_by_emp", None)
+            if x_by_emp:
+                xs = x_by_emp[e]
+            else:
+                xs = [
                     rule.model.x[(e, d, h)]
                     for d in range(rule.model.cfg.DAYS)
                     for h in range(rule.model.cfg.HOURS)
-                )
-            )
-            cache[e] = total
-        return cache[e]
+                ]
+            rule.model.m.Add(total == cp_model.LinearExpr.Sum(xs))
+            totals[e] = total
+            ubs[e] = horizon_ub
+        return totals[e]
 
     return _getter
+
+
+@cache
+def cumulative_penalty_table(scale: float, base: float, steps: int) -> tuple[int, ...]:
+    """
+    Lookup table for AddElement: entry k is Σ_{i=1..k} round(scale * baseⁱ),
+    with entry 0 == 0. Cached because the inputs come from rule settings.
+    """
+    return (0, *accumulate(round(scale * (base**k)) for k in range(1, steps + 1)))
+
+
+def linear_step(table: tuple[int, ...]) -> int | None:
+    """
+    The constant increment of a cumulative penalty table, or None when the
+    steps differ. Rounding small tiers often flattens them to one value, and a
+    linear table can be a coefficient instead of an AddElement lookup.
+    """
+    steps = {hi - lo for lo, hi in pairwise(table)}
+    if len(steps) > 1:
+        return None
+    return steps.pop() if steps else 0
+
+
+def total_hours_ub(model, e: int) -> int:
+    """Upper bound the employee's total-hours var was declared with."""
+    return model._total_hours_ub[e]
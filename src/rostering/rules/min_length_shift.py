@@ -1,3 +1,5 @@
+from ortools.sat.python import cp_model
+
 from rostering.rules.base import Rule
 
 
@@ -17,6 +19,8 @@ class MinShiftLengthRule(Rule):
     def add_hard(self):
         """Enforce min-length constraint by summing realized hour literals."""
         C, m = self.model.cfg, self.model.m
+        # Resolve the UNSAT-core switch once; labels are only built when used.
+        guarded = self._unsat_core_enabled()
         for e in range(C.N):
             for d in range(C.DAYS):
                 # w_cur_list captures hours assigned in the current day; spill_from_day
@@ -28,13 +32,15 @@ class MinShiftLengthRule(Rule):
 
                 if parts:
                     # lhs is the number of realized hour literals that fire.
-                    lhs = sum(parts)
+                    lhs = cp_model.LinearExpr.Sum(parts)
                     # rhs is MIN_SHIFT_HOURS * y[e,d]; if the day is scheduled (y=1)
                     # we require lhs >= rhs, otherwise rhs=0 and constraint is lax.
                     rhs = C.MIN_SHIFT_HOURS * self.model.y[(e, d)]
                     ct = m.Add(lhs >= rhs)
-                    self._guard(ct, f"MINLEN[e={e},d={d}]")
+                    if guarded:
+                        self._guard(ct, f"MINLEN[e={e},d={d}]")
                 else:
                     # If there are no realized hours for this day, force y[e,d] = 0.
                     ct = m.Add(self.model.y[(e, d)] == 0)
-                    self._guard(ct, f"MINLEN-ZERO[e={e},d={d}]")
+                    if guarded:
+                        self._guard(ct, f"MINLEN-ZERO[e={e},d={d}]")
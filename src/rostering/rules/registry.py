@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from typing import Sequence, Tuple, Type
 
 from rostering.rules.availability import AvailabilityRule
@@ -13,6 +14,8 @@ from rostering.rules.rest import RestRule
 from rostering.rules.shift_interval import ShiftIntervalRule
 from rostering.rules.weekly_cap import WeeklyCapRule
 
+logger = logging.getLogger(__name__)
+
 RuleTemplate = Tuple[Type[Rule], int, dict[str, float]]
 
 VARIABLES_RULE_TEMPLATE: RuleTemplate = (VariablesRule, 0, {})
@@ -46,7 +49,7 @@ FAIRNESS_RULE_TEMPLATE: RuleTemplate = (
         "band_shortfall_threshold": 2,
     },
 )
-_DEFAULT_RULE_TEMPLATES: list[RuleTemplate] = [
+_DEFAULT_RULE_TEMPLATES: tuple[RuleTemplate, ...] = (
     VARIABLES_RULE_TEMPLATE,
     AVAILABILITY_RULE_TEMPLATE,
     SHIFT_INTERVAL_RULE_TEMPLATE,
@@ -56,16 +59,17 @@ _DEFAULT_RULE_TEMPLATES: list[RuleTemplate] = [
     WEEKLY_CAP_RULE_TEMPLATE,
     CONSECUTIVE_DAYS_RULE_TEMPLATE,
     FAIRNESS_RULE_TEMPLATE,
-]
+)
 
 
 def default_rule_specs() -> list[RuleSpec]:
     """Return fresh copies of the default rule specifications."""
-    specs: list[RuleSpec] = []
-    print("USING DEFAULT RULES")
-    for cls, order, settings in _DEFAULT_RULE_TEMPLATES:
-        specs.append(RuleSpec(cls=cls, order=order, settings=dict(settings)))
-    return specs
+    logger.debug("Using default rules")
+    # Only the settings dicts are mutable, so they are the only thing copied.
+    return [
+        RuleSpec(cls=cls, order=order, settings=dict(settings))
+        for cls, order, settings in _DEFAULT_RULE_TEMPLATES
+    ]
 
 
 def normalize_rule_specs(
@@ -74,6 +78,10 @@ def normalize_rule_specs(
     """Turn user-provided rules into RuleSpec objects."""
     if rules is None:
         return default_rule_specs()
+    # Already canonical: skip the per-item dispatch below.
+    specs = [item for item in rules if isinstance(item, RuleSpec)]
+    if len(specs) == len(rules):
+        return specs
 
     normalized: list[RuleSpec] = []
     for item in rules:
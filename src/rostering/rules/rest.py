@@ -23,9 +23,13 @@ class RestRule(Rule):
     order = 50
     name = "Rest"
 
+    @classmethod
+    def is_enabled(cls, cfg) -> bool:
+        return cfg.REST_HOURS > 0  # disable with 0
+
     def __init__(self, model, **settings):
         super().__init__(model, **settings)
-        self.enabled = model.cfg.REST_HOURS > 0  # disable with 0
+        self.enabled = self.is_enabled(model.cfg)
 
     def add_hard(self):
         if not self.enabled:
@@ -39,6 +43,5 @@ class RestRule(Rule):
                 if lit is not None:
                     lits.append(lit)
                 M.Add(
-                    self.model.S[(e, d + 1)]
-                    >= C.REST_HOURS + self.model.S[(e, d)] + self.model.L[(e, d)] - 24
+                    self.model.S[(e, d + 1)] >= C.REST_HOURS + self.model.E[(e, d)] - 24
                 ).OnlyEnforceIf(lits)
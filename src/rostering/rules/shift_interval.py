@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from ortools.sat.python import cp_model
+
 from rostering.rules.base import Rule
 
 
@@ -37,7 +39,7 @@ class ShiftIntervalRule(Rule):
 
     Convenience lists (for potential soft objectives elsewhere)
     -----------------------------------------------------------
-    w_cur_list[(e,d)]       : list of w_cur literals that are legal (allowed & not holiday)
+    w_cur_list[(e,d)]       : list of w_cur literals for the encoded (non-folded) hours
     spill_from_day[(e,d)]   : list of spillover literals that originate on day d
     """
 
@@ -68,22 +70,27 @@ class ShiftIntervalRule(Rule):
     # ------------------------------------------------------------------ #
     def add_hard(self):
         C, D, m = self.model.cfg, self.model.data, self.model.m
+        # Slots VariablesRule folded into the constant 0 (holiday or disallowed
+        # hour) get no w_cur / w_prev literals. Otherwise every hour is encoded
+        # and AvailabilityRule alone keeps the blocked ones at 0.
+        folded = getattr(self.model, "x_zero", None) is not None
+        all_hours = list(range(C.HOURS))
+        work_hours_by_day: dict[tuple[int, int], list[int]] = {}
 
-        base_date = C.START_DATE.date()
         for e in range(C.N):
-            allowed_mask = D.allowed[e]
-            forbidden_days = {
-                _day_index_from_any(day, base_date)
-                for day in getattr(D.staff[e], "holidays", set())
-            }
+            # Availability is per hour of day, so split the hours once per
+            # employee; a holiday blocks the whole day.
+            if folded:
+                forbidden_days = D.holiday_days[e]
+                open_hours = [h for h in all_hours if D.allowed[e][h]]
+            else:
+                forbidden_days, open_hours = frozenset(), all_hours
 
             for d in range(C.DAYS):
-                day_blocked = d in forbidden_days
-                for h in range(C.HOURS):
-                    if day_blocked or not allowed_mask[h]:
-                        # Hour is impossible (holiday or blocked), so force x = 0 and continue.
-                        m.Add(self.model.x[(e, d, h)] == 0)
-                        continue
+                work_hours = [] if d in forbidden_days else open_hours
+                work_hours_by_day[(e, d)] = work_hours
+
+                for h in work_hours:
                     # ---------- Current-day coverage: w_cur = y AND (S <= h) AND (h < S+L) ----------
                     # b1 ↔ (S[e,d] ≤ h)
                     b1 = m.NewBoolVar(f"b1_e{e}_d{d}_h{h}")
@@ -92,87 +99,64 @@ class ShiftIntervalRule(Rule):
 
                     # b2 ↔ (h < S[e,d] + L[e,d])  <=>  S+L ≥ h+1
                     b2 = m.NewBoolVar(f"b2_e{e}_d{d}_h{h}")
-                    m.Add(
-                        self.model.S[(e, d)] + self.model.L[(e, d)] >= h + 1
-                    ).OnlyEnforceIf(b2)
-                    m.Add(
-                        self.model.S[(e, d)] + self.model.L[(e, d)] <= h
-                    ).OnlyEnforceIf(b2.Not())
-
-                    w_cur = m.NewBoolVar(f"wcur_e{e}_d{d}_h{h}")
-                    # AND(y, b1, b2)
-                    m.Add(w_cur <= self.model.y[(e, d)])
-                    m.Add(w_cur <= b1)
-                    m.Add(w_cur <= b2)
-                    m.Add(w_cur >= self.model.y[(e, d)] + b1 + b2 - 2)
-
-                    # Respect availability and holidays
-                    if (not allowed_mask[h]) or (d in forbidden_days):
-                        m.Add(w_cur == 0)
+                    m.Add(self.model.E[(e, d)] >= h + 1).OnlyEnforceIf(b2)
+                    m.Add(self.model.E[(e, d)] <= h).OnlyEnforceIf(b2.Not())
+
+                    # Day 0 has no previous day, so nothing spills over and x
+                    # itself is the current-day literal.
+                    x_edh = self.model.x[(e, d, h)]
+                    if d == 0:
+                        w_cur = x_edh
                     else:
-                        self.model.w_cur_list[(e, d)].append(w_cur)
+                        w_cur = m.NewBoolVar(f"wcur_e{e}_d{d}_h{h}")
+                    # AND(y, b1, b2)
+                    _channel_and(m, w_cur, [self.model.y[(e, d)], b1, b2])
+                    self.model.w_cur_list[(e, d)].append(w_cur)
+                    if d == 0:
+                        continue
 
                     # ---------- Previous-day spillover: w_prev ----------
-                    # Always create a BoolVar so we can unify constraints below.
+                    # bHcov ↔ (h < S[e,d-1] + L[e,d-1] - 24)  <=>  S+L ≥ h+25.
+                    # Since h ≥ 0 this already implies the shift ran past
+                    # midnight (S+L ≥ 25), so no separate overrun literal.
+                    bHcov = m.NewBoolVar(f"bHcov_e{e}_d{d}_h{h}")
+                    m.Add(self.model.E[(e, d - 1)] >= h + 25).OnlyEnforceIf(bHcov)
+                    m.Add(self.model.E[(e, d - 1)] <= h + 24).OnlyEnforceIf(bHcov.Not())
+
+                    # AND(y_prev, bHcov)
                     w_prev = m.NewBoolVar(f"wprev_e{e}_d{d}_h{h}")
-                    if d == 0:
-                        # Day 0 has no previous day: fix to 0.
-                        m.Add(w_prev == 0)
-                    else:
-                        # bOver ↔ (S[e,d-1] + L[e,d-1] > 24)  (encode as ≥25 since hours are integers)
-                        bOver = m.NewBoolVar(f"bOver_e{e}_d{d}_h{h}")
-                        m.Add(
-                            self.model.S[(e, d - 1)] + self.model.L[(e, d - 1)] >= 25
-                        ).OnlyEnforceIf(bOver)
-                        m.Add(
-                            self.model.S[(e, d - 1)] + self.model.L[(e, d - 1)] <= 24
-                        ).OnlyEnforceIf(bOver.Not())
-
-                        # bHcov ↔ (h < S[e,d-1] + L[e,d-1] - 24)  <=>  S+L ≥ h+25
-                        bHcov = m.NewBoolVar(f"bHcov_e{e}_d{d}_h{h}")
-                        m.Add(
-                            self.model.S[(e, d - 1)] + self.model.L[(e, d - 1)]
-                            >= h + 25
-                        ).OnlyEnforceIf(bHcov)
-                        m.Add(
-                            self.model.S[(e, d - 1)] + self.model.L[(e, d - 1)]
-                            <= h + 24
-                        ).OnlyEnforceIf(bHcov.Not())
-
-                        # AND(y_prev, bOver, bHcov)
-                        m.Add(w_prev <= self.model.y[(e, d - 1)])
-                        m.Add(w_prev <= bOver)
-                        m.Add(w_prev <= bHcov)
-                        m.Add(w_prev >= self.model.y[(e, d - 1)] + bOver + bHcov - 2)
-
-                        if (not allowed_mask[h]) or (d in forbidden_days):
-                            m.Add(w_prev == 0)
-                        else:
-                            # Track spillover literals by the day they originate from (d-1)
-                            self.model.spill_from_day[(e, d - 1)].append(w_prev)
+                    _channel_and(m, w_prev, [self.model.y[(e, d - 1)], bHcov])
+                    # Track spillover literals by the day they originate from (d-1)
+                    self.model.spill_from_day[(e, d - 1)].append(w_prev)
 
                     # ---------- Hour worked indicator: x = OR(w_cur, w_prev) ----------
-                    # For Booleans, max equals OR.
-                    m.AddMaxEquality(self.model.x[(e, d, h)], [w_cur, w_prev])
+                    # Either literal implies x, and x needs one of them.
+                    m.AddImplication(w_cur, x_edh)
+                    m.AddImplication(w_prev, x_edh)
+                    m.AddBoolOr([w_cur, w_prev, x_edh.Not()])
 
         # ---------- Day worked indicator: z[e,d] ⇔ any hour worked ----------
-        for e in range(C.N):
-            for d in range(C.DAYS):
-                total = sum(self.model.x[(e, d, h)] for h in range(C.HOURS))
-                # If z=1 then at least one hour must be worked.
-                m.Add(total >= 1).OnlyEnforceIf(self.model.z[(e, d)])
-                # If z=0 then no hour may be worked.
-                m.Add(total == 0).OnlyEnforceIf(self.model.z[(e, d)].Not())
-
-
-def _day_index_from_any(value, base_date):
-    from datetime import date as _date
-    from datetime import datetime as _datetime
-
-    if isinstance(value, int):
-        return value
-    if isinstance(value, _datetime):
-        value = value.date()
-    if isinstance(value, _date):
-        return int((value - base_date).days)
-    raise TypeError("Holiday entries must be ints or datetime/date objects.")
+        # Folded hours are the constant 0, so only encoded hours matter;
+        # clauses propagate by watched literals, unlike HOURS-wide linear sums.
+        for (e, d), hours in work_hours_by_day.items():
+            z_ed = self.model.z[(e, d)]
+            xs = [self.model.x[(e, d, h)] for h in hours]
+            if not xs:
+                m.Add(z_ed == 0)
+                continue
+            # If z=1 then at least one hour must be worked.
+            m.AddBoolOr(xs).OnlyEnforceIf(z_ed)
+            # If z=0 then no hour may be worked.
+            m.AddBoolAnd([x.Not() for x in xs]).OnlyEnforceIf(z_ed.Not())
+
+
+def _channel_and(
+    m: cp_model.CpModel, target: cp_model.IntVar, lits: list[cp_model.IntVar]
+) -> None:
+    """
+    target ⇔ AND(lits) as clauses: target implies every literal, and all
+    literals together imply target. Clauses propagate by watched literals,
+    cheaper than the equivalent linear rows.
+    """
+    m.AddBoolAnd(lits).OnlyEnforceIf(target)
+    m.AddBoolOr([lit.Not() for lit in lits] + [target])
@@ -1,5 +1,5 @@
 from rostering.rules.base import Rule
-from rostering.rules.helpers import ensure_total_hours
+from rostering.rules.helpers import ensure_total_hours, total_hours_ub
 
 
 class WeeklyCapRule(Rule):
@@ -13,19 +13,29 @@ class WeeklyCapRule(Rule):
     order = 70
     name = "WeeklyCap"
 
+    @classmethod
+    def is_enabled(cls, cfg) -> bool:
+        return cfg.WEEKLY_MAX_HOURS is not None  # toggle by setting to None
+
     def __init__(self, model, **settings):
         super().__init__(model, **settings)
-        self.enabled = (
-            model.cfg.WEEKLY_MAX_HOURS is not None
-        )  # toggle by setting to None
+        self.enabled = self.is_enabled(model.cfg)
 
     def add_hard(self):
         if not self.enabled:
             return
         C, M = self.model.cfg, self.model.m
         cap = int(C.WEEKLY_MAX_HOURS)
-        get_total = ensure_total_hours(self, int(C.DAYS * C.HOURS))
+        horizon = int(C.DAYS * C.HOURS)
+        # Unguarded, the cap is simply the total's upper bound (this rule runs
+        # before fairness, so it normally declares the totals). Guarded caps
+        # stay explicit constraints so they can appear in an UNSAT core.
+        guarded = self._unsat_core_enabled()
+        get_total = ensure_total_hours(self, horizon if guarded else min(cap, horizon))
         for e in range(C.N):
             total = get_total(e)
+            if not guarded and total_hours_ub(self.model, e) <= cap:
+                continue
             ct = M.Add(total <= cap)
-            self._guard(ct, f"WEEKLY-CAP[e={e}]")
+            if guarded:
+                self._guard(ct, f"WEEKLY-CAP[e={e}]")
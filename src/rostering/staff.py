@@ -8,10 +8,13 @@ from typing import Any, Iterable, Optional
 def _normalize_date_set(values: Iterable[Any]) -> set[date]:
     out: set[date] = set()
     for val in values:
-        if isinstance(val, date) and not isinstance(val, datetime):
+        # Plain dates are the common case; check the exact type before isinstance.
+        if type(val) is date:
             out.add(val)
         elif isinstance(val, datetime):
             out.add(val.date())
+        elif isinstance(val, date):
+            out.add(val)
         else:
             raise TypeError(
                 "Holidays/preferred_off entries must be datetime.date or datetime.datetime."
@@ -48,14 +51,13 @@ class Staff:
         )
 
     def __post_init__(self) -> None:
+        # Rules read band / max_consec_days directly, so coerce them once here.
+        self.band = int(self.band)
+        if self.max_consec_days is not None:
+            self.max_consec_days = int(self.max_consec_days)
         self.holidays = _normalize_date_set(self.holidays)
         self.preferred_off = _normalize_date_set(self.preferred_off)
         if "ANY" not in self.skills:
             self.skills.append("ANY")
-        seen = set()
-        dedup: list[str] = []
-        for skill in self.skills:
-            if skill not in seen:
-                seen.add(skill)
-                dedup.append(skill)
-        self.skills = dedup
+        # dict preserves insertion order, so this keeps the first occurrence.
+        self.skills = list(dict.fromkeys(self.skills))
@@ -96,8 +96,11 @@ def test_assign_time_off_never_overlaps(days: int = 5):
     )
     for s in staff:
         assert s.holidays.isdisjoint(s.preferred_off)
-        assert all(isinstance(d, date) for d in s.holidays | s.preferred_off)
-        assert all(0 <= (d - start).days < days for d in s.holidays | s.preferred_off)
+        off = s.holidays | s.preferred_off
+        assert {type(d) for d in off} <= {date}
+        offsets = np.fromiter((d.toordinal() for d in off), dtype=np.int64)
+        offsets -= start.toordinal()
+        assert offsets.size == 0 or (offsets.min() >= 0 and offsets.max() < days)
 
 
 def test_allowed_hours_day_vs_night_workers():
@@ -205,65 +208,65 @@ def test_staff_summary_returns_expected_fractions():
     assert summary["capped_pct"] == 0.5
 
 
-def _write_staff_file(path: Path, entries: list[dict]) -> Path:
-    path.write_text(json.dumps(entries))
-    return path
-
-
-def test_staff_from_json_reads_custom_file(tmp_path):
-    path = _write_staff_file(
-        tmp_path / "custom.json",
-        [
-            {
-                "id": 1,
-                "name": "Alice",
-                "band": 2,
-                "skills": ["A"],
-                "is_night_worker": True,
-                "max_consec_days": 4,
-                "holidays": ["2024-01-02"],
-                "preferred_off": ["2024-01-03"],
-            },
-            {
-                "id": 2,
-                "name": "Bob",
-                "band": 1,
-                "skills": ["B"],
-            },
-        ],
-    )
-    staff = staff_from_json(path)
+@pytest.fixture(scope="session")
+def staff_json_dir(tmp_path_factory) -> Path:
+    """
+    Write the staff JSON inputs once per session; the tests only read them.
+    """
+    root = tmp_path_factory.mktemp("staff_json")
+    custom = [
+        {
+            "id": 1,
+            "name": "Alice",
+            "band": 2,
+            "skills": ["A"],
+            "is_night_worker": True,
+            "max_consec_days": 4,
+            "holidays": ["2024-01-02"],
+            "preferred_off": ["2024-01-03"],
+        },
+        {
+            "id": 2,
+            "name": "Bob",
+            "band": 1,
+            "skills": ["B"],
+        },
+    ]
+    default = [
+        {
+            "id": 5,
+            "name": "Default",
+            "band": 3,
+            "skills": ["X"],
+        }
+    ]
+    (root / "custom.json").write_text(json.dumps(custom))
+    (root / "default.json").write_text(json.dumps(default))
+    (root / "not_json.txt").write_text("[]")
+    return root
+
+
+def test_staff_from_json_reads_custom_file(staff_json_dir):
+    staff = staff_from_json(staff_json_dir / "custom.json")
     assert [s.name for s in staff] == ["Alice", "Bob"]
     assert staff[0].holidays == {date.fromisoformat("2024-01-02")}
     assert staff[0].preferred_off == {date.fromisoformat("2024-01-03")}
     assert staff[1].max_consec_days is None
 
 
-def test_staff_from_json_uses_default_file_when_omitted(monkeypatch, tmp_path):
-    default = tmp_path / "default.json"
-    _write_staff_file(
-        default,
-        [
-            {
-                "id": 5,
-                "name": "Default",
-                "band": 3,
-                "skills": ["X"],
-            }
-        ],
+def test_staff_from_json_uses_default_file_when_omitted(monkeypatch, staff_json_dir):
+    monkeypatch.setattr(
+        staff_mod, "DEFAULT_STAFF_JSON", staff_json_dir / "default.json"
     )
-    monkeypatch.setattr(staff_mod, "DEFAULT_STAFF_JSON", default)
     staff = staff_from_json()
     assert len(staff) == 1
     assert staff[0].name == "Default"
 
 
-def test_staff_from_json_requires_json_file(tmp_path):
-    bad_path = tmp_path / "not_json.txt"
-    bad_path.write_text("[]")
+def test_staff_from_json_requires_json_file(staff_json_dir):
     with pytest.raises(ValueError):
-        staff_from_json(bad_path)
+        staff_from_json(staff_json_dir / "not_json.txt")
 
-    missing = tmp_path / "missing.json"
+    missing = staff_json_dir / "missing.json"
     with pytest.raises(FileNotFoundError):
         staff_from_json(missing)
@@ -0,0 +1,98 @@
+# tests/rostering/reporting/conftest.py
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from types import SimpleNamespace
+
+import matplotlib
+import pandas as pd
+import pytest
+
+# Pick the non-interactive backend before any reporting module imports pyplot,
+# so no GUI backend is initialised and nothing has to switch backends later.
+matplotlib.use("Agg")
+
+from rostering.config import Config
+from rostering.input_data import InputData
+from rostering.reporting.adapters import PandasResultAdapter
+from rostering.staff import Staff
+
+
+# -----------------------------
+# Shared one-employee, one-day fixtures
+# -----------------------------
+@pytest.fixture(scope="session")
+def reporting_cfg() -> Config:
+    """
+    One employee, one day, 24 hours, skill "A" required every hour.
+    Built once per session; reporting code only reads from it.
+    """
+    cfg = Config(
+        N=1,
+        DAYS=1,
+        HOURS=24,
+        START_DATE=datetime(2024, 1, 1),
+        MIN_SHIFT_HOURS=1,
+        MAX_SHIFT_HOURS=1,
+        REST_HOURS=0,
+        TIME_LIMIT_SEC=1.0,
+        NUM_PARALLEL_WORKERS=1,
+        LOG_SOLUTIONS_FREQUENCY_SECONDS=1.0,
+        WEEKLY_MAX_HOURS=10,
+    )
+    cfg.SKILL_MIN = [[{"A": 1} for _ in range(cfg.HOURS)]]
+    return cfg
+
+
+@pytest.fixture(scope="session")
+def reporting_data(reporting_cfg: Config) -> InputData:
+    """InputData for a single always-available employee holding skill "A"."""
+    staff = [
+        Staff(
+            id=0,
+            name="A",
+            band=1,
+            skills=["A"],
+            is_night_worker=False,
+            max_consec_days=None,
+        )
+    ]
+    allowed = [[True] * reporting_cfg.HOURS]
+    return InputData(staff=staff, cfg=reporting_cfg, allowed=allowed)
+
+
+@pytest.fixture(scope="session")
+def pandas_adapter() -> PandasResultAdapter:
+    """The default result adapter; it keeps no state, so one instance is shared."""
+    return PandasResultAdapter()
+
+
+@pytest.fixture(scope="session")
+def make_reporting_result(
+    reporting_data: InputData,
+) -> Callable[..., SimpleNamespace]:
+    """
+    Factory for a solved result over `reporting_data`: its one employee works a
+    single 8-hour shift from hour 0 of day 0. The frames are built once and
+    shared; the reporting code only reads them.
+    """
+    emp = reporting_data.staff[0].id
+    df_emp = pd.DataFrame({"employee_id": [emp], "hours": [8]})
+    df_sched = pd.DataFrame({"employee_id": [emp], "day": [0], "hour": [0]})
+    df_shifts = pd.DataFrame(
+        {"employee_id": [emp], "start_day": [0], "start_hour": [0], "length_h": [8]}
+    )
+
+    def make(status: str = "FEASIBLE") -> SimpleNamespace:
+        return SimpleNamespace(
+            status_name=status,
+            objective_value=123.0,
+            avg_run=2.0,
+            max_run=3.0,
+            df_emp=df_emp,
+            df_sched=df_sched,
+            df_shifts=df_shifts,
+        )
+
+    return make
@@ -4,11 +4,8 @@ from types import SimpleNamespace
 
 import pandas as pd
 
-from rostering.reporting.adapters import PandasResultAdapter
 
-
-def test_df_sched_normalises_columns():
-    adapter = PandasResultAdapter()
+def test_df_sched_normalises_columns(pandas_adapter):
     df = pd.DataFrame(
         {
             "Employee_ID": [3, 4],
@@ -19,14 +16,13 @@ def test_df_sched_normalises_columns():
     )
     res = SimpleNamespace(df_sched=df)
 
-    normalized = adapter.df_sched(res)
+    normalized = pandas_adapter.df_sched(res)
 
     assert list(normalized.columns) == ["employee_id", "day", "hour"]
     assert normalized.iloc[0].tolist() == [3, 0, 1]
 
 
-def test_df_shifts_handles_dates_and_missing_cols():
-    adapter = PandasResultAdapter()
+def test_df_shifts_handles_dates_and_missing_cols(pandas_adapter):
     df = pd.DataFrame(
         {
             "employee_id": [1],
@@ -37,7 +33,7 @@ def test_df_shifts_handles_dates_and_missing_cols():
     )
     res = SimpleNamespace(df_shifts=df)
 
-    normalized = adapter.df_shifts(res)
+    normalized = pandas_adapter.df_shifts(res)
 
     assert list(normalized.columns) == [
         "employee_id",
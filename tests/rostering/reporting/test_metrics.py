@@ -4,6 +4,7 @@ from datetime import datetime
 from types import SimpleNamespace
 
 import pandas as pd
+import pytest
 
 from rostering.config import Config
 from rostering.input_data import InputData
@@ -11,6 +12,10 @@ from rostering.reporting import data_models, metrics
 from rostering.reporting.adapters import ResultAdapter
 from rostering.staff import Staff
 
+# Read-only schedule frames shared by the tests below.
+_SCHED_SINGLE = pd.DataFrame({"employee_id": [0], "day": [0], "hour": [0]})
+_SCHED_TWO_HOURS = pd.DataFrame({"employee_id": [0, 0], "day": [0, 0], "hour": [0, 1]})
+
 
 class StubAdapter(ResultAdapter):
     def __init__(
@@ -48,20 +53,17 @@ def simple_cfg(skills: list[list[dict[str, int]]], hours: int) -> SimpleNamespac
 
 
 def _input_cfg(n: int) -> Config:
+    # One 24-hour day with no demand: __post_init__ fills empty SKILL_MIN and
+    # SKILL_MAX grids, and every hour is passed to InputData as allowed.
     return Config(
-        N=n,
-        DAYS=1,
-        HOURS=24,
-        START_DATE=datetime(2024, 1, 1),
-        MIN_SHIFT_HOURS=1,
-        MAX_SHIFT_HOURS=1,
-        REST_HOURS=0,
-        TIME_LIMIT_SEC=1.0,
-        NUM_PARALLEL_WORKERS=1,
-        LOG_SOLUTIONS_FREQUENCY_SECONDS=1.0,
+        N=n, DAYS=1, HOURS=24, START_DATE=datetime(2024, 1, 1), DEFAULT_MIN_STAFF=0
     )
 
 
+def _all_allowed(n: int) -> list[list[bool]]:
+    return [[True] * 24 for _ in range(n)]
+
+
 def make_input(staff_skills: list[set[str]]) -> InputData:
     staff_objs = []
     for idx, skills in enumerate(staff_skills):
@@ -78,7 +80,13 @@ def make_input(staff_skills: list[set[str]]) -> InputData:
             )
         )
     cfg = _input_cfg(len(staff_objs))
-    return InputData(staff=staff_objs, cfg=cfg)
+    return InputData(staff=staff_objs, cfg=cfg, allowed=_all_allowed(cfg.N))
+
+
+@pytest.fixture(scope="module")
+def single_a_data() -> InputData:
+    """One always-available employee holding skill "A"; metrics only read it."""
+    return make_input([{"A"}])
 
 
 def test_slot_requirements_builds_expected_grid():
@@ -101,15 +109,12 @@ def test_assigned_sets_prefers_schedule_over_shifts():
     assert assigned[(0, 2)] == {1}
 
 
-def test_compute_coverage_metrics_counts_supply_and_shortfalls():
+def test_compute_coverage_metrics_counts_supply_and_shortfalls(single_a_data):
     cfg = simple_cfg([[{"A": 1}]], hours=1)
-    adapter = StubAdapter(
-        sched=pd.DataFrame({"employee_id": [0], "day": [0], "hour": [0]})
-    )
-    data = make_input([{"A"}])
+    adapter = StubAdapter(sched=_SCHED_SINGLE)
     res = SimpleNamespace()
 
-    cov = metrics.compute_coverage_metrics(cfg, res, data, adapter)
+    cov = metrics.compute_coverage_metrics(cfg, res, single_a_data, adapter)
 
     assert cov.skill_demand_hours == 1
     assert cov.assigned_people_hours == 1
@@ -117,47 +122,21 @@ def test_compute_coverage_metrics_counts_supply_and_shortfalls():
     assert cov.unmatched_assignments_on_demand == 0
 
 
-def test_compute_slot_gaps_marks_unattainable_slots():
+def test_compute_slot_gaps_marks_unattainable_slots(single_a_data):
     cfg = simple_cfg([[{"A": 2}]], hours=1)
-    adapter = StubAdapter(
-        sched=pd.DataFrame({"employee_id": [0], "day": [0], "hour": [0]})
-    )
+    adapter = StubAdapter(sched=_SCHED_SINGLE)
     # Only one staff member available, so slot is unattainable
-    staff = [
-        Staff(
-            id=0,
-            name="Only",
-            band=1,
-            skills=["A"],
-            is_night_worker=False,
-            max_consec_days=None,
-            holidays=set(),
-            preferred_off=set(),
-        )
-    ]
-    cfg_data = _input_cfg(len(staff))
-    data = InputData(staff=staff, cfg=cfg_data)
-    top, df = metrics.compute_slot_gaps(cfg, None, data, adapter, top=1)
+    top, df = metrics.compute_slot_gaps(cfg, None, single_a_data, adapter, top=1)
 
     assert top[0].unattainable is True
     assert df.iloc[0]["deficit"] == 1
 
 
-def test_avg_staffing_by_hour_and_skill_returns_series():
+def test_avg_staffing_by_hour_and_skill_returns_series(single_a_data):
     cfg = simple_cfg([[{"A": 1}]], hours=2)
-    adapter = StubAdapter(
-        sched=pd.DataFrame(
-            {
-                "employee_id": [0, 0],
-                "day": [0, 0],
-                "hour": [0, 1],
-            }
-        )
-    )
-    data = make_input([{"A"}])
-
+    adapter = StubAdapter(sched=_SCHED_TWO_HOURS)
     overall, per_skill = metrics.avg_staffing_by_hour_and_skill(
-        cfg, None, data, adapter
+        cfg, None, single_a_data, adapter
     )
     assert list(overall.index) == [0, 1]
     assert per_skill["A"].tolist() == [1.0, 1.0]
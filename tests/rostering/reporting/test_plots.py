@@ -1,19 +1,15 @@
 from __future__ import annotations
 
-from datetime import datetime
-
-import matplotlib
 import pandas as pd
 
-matplotlib.use("Agg", force=True)
-from rostering.config import Config
-from rostering.input_data import InputData
 from rostering.reporting.adapters import ResultAdapter
 from rostering.reporting.plots import (
     show_hour_of_day_histograms,
     show_solution_progress,
 )
-from rostering.staff import Staff
+
+# Read-only schedule frame: one employee working hour 0 of day 0.
+_SCHED_SINGLE = pd.DataFrame({"employee_id": [0], "day": [0], "hour": [0]})
 
 
 class TinyAdapter(ResultAdapter):
@@ -42,50 +38,16 @@ class TinyAdapter(ResultAdapter):
         return pd.DataFrame()
 
 
-def make_cfg() -> Config:
-    cfg = Config(
-        N=1,
-        DAYS=1,
-        HOURS=24,
-        START_DATE=datetime(2024, 1, 1),
-        MIN_SHIFT_HOURS=1,
-        MAX_SHIFT_HOURS=1,
-        REST_HOURS=0,
-        TIME_LIMIT_SEC=1.0,
-        NUM_PARALLEL_WORKERS=1,
-        LOG_SOLUTIONS_FREQUENCY_SECONDS=1.0,
-    )
-    cfg.SKILL_MIN = [[{"A": 1} for _ in range(cfg.HOURS)]]
-    return cfg
-
-
-def make_data():
-    staff = [
-        Staff(
-            id=0,
-            name="A",
-            band=1,
-            skills=["A"],
-            is_night_worker=False,
-            max_consec_days=None,
-        )
-    ]
-    cfg = make_cfg()
-    allowed = [[True] * cfg.HOURS]
-    return InputData(staff=staff, cfg=cfg, allowed=allowed)
-
-
-def test_hour_of_day_histogram_saves(monkeypatch):
+def test_hour_of_day_histogram_saves(monkeypatch, reporting_cfg, reporting_data):
     saved = {}
 
     def fake_save(fig, name):
         saved["name"] = name
 
     monkeypatch.setattr("rostering.reporting.plots._save_and_show", fake_save)
-    df = pd.DataFrame({"employee_id": [0], "day": [0], "hour": [0]})
-    adapter = TinyAdapter(df)
+    adapter = TinyAdapter(_SCHED_SINGLE)
 
-    show_hour_of_day_histograms(make_cfg(), object(), make_data(), adapter)
+    show_hour_of_day_histograms(reporting_cfg, object(), reporting_data, adapter)
     assert saved["name"] == "hour_of_day_skill_bar_chart.png"
 
 
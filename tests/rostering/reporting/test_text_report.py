@@ -1,89 +1,88 @@
 from __future__ import annotations
 
-from datetime import datetime
-from types import SimpleNamespace
-
+import matplotlib.pyplot as plt
 import pandas as pd
 
-from rostering.config import Config
-from rostering.input_data import InputData
-from rostering.reporting.adapters import PandasResultAdapter
-from rostering.reporting.text_report import render_text_report
-from rostering.staff import Staff
-
-
-def make_cfg():
-    cfg = Config(
-        N=1,
-        DAYS=1,
-        HOURS=24,
-        START_DATE=datetime(2024, 1, 1),
-        MIN_SHIFT_HOURS=1,
-        MAX_SHIFT_HOURS=1,
-        REST_HOURS=0,
-        TIME_LIMIT_SEC=1.0,
-        NUM_PARALLEL_WORKERS=1,
-        LOG_SOLUTIONS_FREQUENCY_SECONDS=1.0,
-        WEEKLY_MAX_HOURS=10,
-    )
-    cfg.SKILL_MIN = [[{"A": 1} for _ in range(cfg.HOURS)]]
-    return cfg
-
-
-def make_data():
-    staff = [
-        Staff(
-            id=0,
-            name="A",
-            band=1,
-            skills=["A"],
-            is_night_worker=False,
-            max_consec_days=None,
-        )
-    ]
-    cfg = make_cfg()
-    return InputData(staff=staff, cfg=cfg)
-
-
-def make_result(status: str = "FEASIBLE"):
-    return SimpleNamespace(
-        status_name=status,
-        objective_value=123.0,
-        avg_run=2.0,
-        max_run=3.0,
-        df_emp=pd.DataFrame({"employee_id": [0], "hours": [8]}),
-        df_sched=pd.DataFrame({"employee_id": [0], "day": [0], "hour": [0]}),
-        df_shifts=pd.DataFrame(
-            {
-                "employee_id": [0],
-                "start_day": [0],
-                "start_hour": [0],
-                "length_h": [8],
-            }
-        ),
-    )
+from rostering.model import SolveResult
+from rostering.reporting.text_report import ReportDocument, render_text_report
 
 
-def test_render_text_report_prints_summary(capsys):
-    cfg = make_cfg()
-    data = make_data()
-    res = make_result()
-    adapter = PandasResultAdapter()
+def test_render_text_report_prints_summary(
+    capsys, reporting_cfg, reporting_data, pandas_adapter, make_reporting_result
+):
+    res = make_reporting_result()
 
-    render_text_report(cfg, adapter, res, data, num_print_examples=1)
+    render_text_report(
+        reporting_cfg, pandas_adapter, res, reporting_data, num_print_examples=1
+    )
     out = capsys.readouterr().out
     assert "Solver status: FEASIBLE" in out
     assert "assigned_people_hours" in out
     assert "Objective value" in out
 
 
-def test_render_text_report_handles_infeasible(capsys):
-    cfg = make_cfg()
-    data = make_data()
-    res = make_result(status="INFEASIBLE")
-    adapter = PandasResultAdapter()
+def test_render_text_report_handles_infeasible(
+    capsys, reporting_cfg, reporting_data, pandas_adapter, make_reporting_result
+):
+    res = make_reporting_result(status="INFEASIBLE")
 
-    render_text_report(cfg, adapter, res, data)
+    render_text_report(reporting_cfg, pandas_adapter, res, reporting_data)
     out = capsys.readouterr().out
     assert "INFEASIBLE" in out
     assert "No feasible schedule" in out
+
+
+def test_render_text_report_omits_percentiles_for_small_rosters(
+    capsys, reporting_cfg, reporting_data, pandas_adapter, make_reporting_result
+):
+    res = make_reporting_result()
+
+    render_text_report(reporting_cfg, pandas_adapter, res, reporting_data)
+    out = capsys.readouterr().out
+    assert "Hours distribution across employees: mean=8.00" in out
+    assert "p5=" not in out
+
+
+def test_render_text_report_shows_percentiles_beyond_printed_rows(
+    capsys, reporting_cfg, reporting_data, pandas_adapter, make_reporting_result
+):
+    res = make_reporting_result()
+    res.df_emp = pd.DataFrame({"employee_id": [0, 1], "hours": [8, 6]})
+
+    render_text_report(
+        reporting_cfg, pandas_adapter, res, reporting_data, num_print_examples=1
+    )
+    assert "p5=" in capsys.readouterr().out
+
+
+def test_report_document_writes_text_and_figure_pages(tmp_path):
+    doc = ReportDocument(tmp_path / "report.pdf")
+    doc.add_text("Solver status: FEASIBLE")
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    doc.add_figure(fig)
+    doc.write()
+
+    pdf = (tmp_path / "report.pdf").read_bytes()
+    assert pdf.startswith(b"%PDF")
+    assert b"/Count 2" in pdf
+
+
+def test_render_text_report_accepts_solve_result(
+    capsys, reporting_cfg, reporting_data, pandas_adapter, make_reporting_result
+):
+    ns = make_reporting_result()
+    res = SolveResult(
+        status_name=ns.status_name,
+        objective_value=ns.objective_value,
+        df_sched=ns.df_sched,
+        df_shifts=ns.df_shifts,
+        df_emp=ns.df_emp,
+        avg_run=ns.avg_run,
+        max_run=ns.max_run,
+        unsat_core_groups={},
+    )
+
+    render_text_report(reporting_cfg, pandas_adapter, res, reporting_data)
+    out = capsys.readouterr().out
+    assert "All employees within weekly cap (10h)." in out
@@ -0,0 +1,117 @@
+# tests/rostering/rules/conftest.py
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from ortools.sat.python import cp_model
+
+from rostering.config import Config
+from rostering.input_data import InputData
+from rostering.staff import Staff
+
+RuleCtxFactory = Callable[..., SimpleNamespace]
+
+
+def _fresh_ctx(inputs: SimpleNamespace, *, with_z: bool = False) -> SimpleNamespace:
+    """
+    Wrap shared cfg/data in a new CpModel with its own x (and optionally z) vars.
+    Rules add variables and constraints to the model, so it is never shared.
+    """
+    cfg = inputs.cfg
+    model = cp_model.CpModel()
+    x = {
+        (e, d, h): model.NewBoolVar(f"x_{e}_{d}_{h}")
+        for e in range(cfg.N)
+        for d in range(cfg.DAYS)
+        for h in range(cfg.HOURS)
+    }
+    ctx = SimpleNamespace(cfg=cfg, data=inputs.data, m=model, x=x)
+    if with_z:
+        ctx.z = {
+            (e, d): model.NewBoolVar(f"z_{e}_{d}")
+            for e in range(cfg.N)
+            for d in range(cfg.DAYS)
+        }
+    return ctx
+
+
+@pytest.fixture(scope="session")
+def rule_ctx_factory() -> RuleCtxFactory:
+    """Build a fresh rule ctx from session inputs; for tests needing several."""
+    return _fresh_ctx
+
+
+# -----------------------------
+# Fairness: three bands, one short day
+# -----------------------------
+@pytest.fixture(scope="session")
+def fairness_inputs() -> SimpleNamespace:
+    """Three single-skill employees in bands 1-3 over one 4-hour day."""
+    cfg = Config(
+        N=3,
+        DAYS=1,
+        HOURS=4,
+        MIN_SHIFT_HOURS=1,
+        MAX_SHIFT_HOURS=2,
+        REST_HOURS=0,
+        TIME_LIMIT_SEC=1.0,
+        NUM_PARALLEL_WORKERS=1,
+        LOG_SOLUTIONS_FREQUENCY_SECONDS=1.0,
+    )
+    staff = [
+        Staff(id=0, name="Ben", band=1, skills=["ANY"]),
+        Staff(id=1, name="Harry", band=2, skills=["ANY"]),
+        Staff(id=2, name="Luke", band=3, skills=["ANY"]),
+    ]
+    allowed = [[True for _ in range(cfg.HOURS)] for _ in range(cfg.N)]
+    data = InputData(staff=staff, cfg=cfg, allowed=allowed)
+    return SimpleNamespace(cfg=cfg, data=data)
+
+
+@pytest.fixture
+def fairness_ctx(fairness_inputs: SimpleNamespace) -> SimpleNamespace:
+    return _fresh_ctx(fairness_inputs)
+
+
+# -----------------------------
+# Consecutive days: one capped employee, three full days
+# -----------------------------
+@pytest.fixture(scope="session")
+def consecutive_inputs() -> SimpleNamespace:
+    """Two employees over three 24-hour days; employee 0 is capped at 2 days."""
+    n = 2
+    cfg = Config(
+        N=n,
+        DAYS=3,
+        HOURS=24,
+        START_DATE=datetime(2024, 1, 1),
+        MIN_SHIFT_HOURS=1,
+        MAX_SHIFT_HOURS=12,
+        REST_HOURS=0,
+        TIME_LIMIT_SEC=1.0,
+        NUM_PARALLEL_WORKERS=1,
+        LOG_SOLUTIONS_FREQUENCY_SECONDS=1.0,
+        ENABLE_UNSAT_CORE=False,
+    )
+    staff = [
+        Staff(
+            id=i,
+            name=f"S{i}",
+            band=1,
+            skills=["ANY"],
+            is_night_worker=False,
+            max_consec_days=2 if i == 0 else None,
+        )
+        for i in range(n)
+    ]
+    allowed = [[True for _ in range(cfg.HOURS)] for _ in range(cfg.N)]
+    data = InputData(staff=staff, cfg=cfg, allowed=allowed)
+    return SimpleNamespace(cfg=cfg, data=data)
+
+
+@pytest.fixture
+def consecutive_ctx(consecutive_inputs: SimpleNamespace) -> SimpleNamespace:
+    return _fresh_ctx(consecutive_inputs, with_z=True)
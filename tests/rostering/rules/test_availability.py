@@ -0,0 +1,75 @@
+from datetime import timedelta
+
+import numpy as np
+import pytest
+from ortools.sat.python import cp_model
+
+from rostering.build import build_model
+from rostering.config import Config
+from rostering.input_data import InputData
+from rostering.rules.availability import AvailabilityRule, forbidden_slot_mask
+from rostering.rules.registry import default_rule_specs
+from rostering.staff import Staff
+
+
+def test_forbidden_slot_mask_combines_holidays_and_hours():
+    holiday_mask = np.array([[False, True, False]])
+    forb = forbidden_slot_mask([[True, False, True, True]], holiday_mask, 4)
+    expected = np.array(
+        [
+            [
+                [False, True, False, False],
+                [True, True, True, True],
+                [False, True, False, False],
+            ]
+        ]
+    )
+    np.testing.assert_array_equal(forb, expected)
+
+
+def test_input_data_precomputes_holiday_day_indices():
+    cfg = Config(N=2, DAYS=3, HOURS=4)
+    base = cfg.START_DATE.date()
+    staff = [
+        Staff(id=0, name="A", band=1, skills=[], holidays={base + timedelta(days=1)}),
+        Staff(id=1, name="B", band=1, skills=[]),
+    ]
+    data = InputData(staff=staff, cfg=cfg, allowed=[[True] * 24] * 2)
+    assert data.holiday_days == [frozenset({1}), frozenset()]
+    assert data.holiday_mask.tolist() == [[False, True, False], [False, False, False]]
+
+
+@pytest.mark.parametrize("enable_unsat_core", [False, True])
+@pytest.mark.parametrize("with_availability", [True, False])
+def test_only_availability_rule_keeps_holiday_slots_off(
+    enable_unsat_core, with_availability
+):
+    cfg = Config(
+        N=1,
+        DAYS=2,
+        HOURS=4,
+        MIN_SHIFT_HOURS=1,
+        MAX_SHIFT_HOURS=2,
+        REST_HOURS=0,
+        WEEKLY_MAX_HOURS=None,
+        NUM_PARALLEL_WORKERS=1,
+        ENABLE_UNSAT_CORE=enable_unsat_core,
+        DEFAULT_MIN_STAFF=0,
+    )
+    holiday = cfg.START_DATE.date() + timedelta(days=1)
+    staff = [Staff(id=0, name="A", band=1, skills=["ANY"], holidays={holiday})]
+    data = InputData(staff=staff, cfg=cfg, allowed=[[True] * 24])
+    rules = [
+        spec
+        for spec in default_rule_specs()
+        if with_availability or spec.cls is not AvailabilityRule
+    ]
+    ctx = build_model(cfg, data, rules)
+    ctx.m.Add(ctx.x[(0, 1, 1)] == 1)  # work an hour of the holiday
+
+    status = cp_model.CpSolver().Solve(ctx.m)
+
+    if with_availability:
+        assert status == cp_model.INFEASIBLE
+    else:
+        assert status == cp_model.OPTIMAL
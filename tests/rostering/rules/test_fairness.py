@@ -2,47 +2,11 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
-from ortools.sat.python import cp_model
-
-from rostering.config import Config
-from rostering.input_data import InputData
-from rostering.rules.fairness import FairnessRule
-from rostering.staff import Staff
-
-
-def _make_ctx() -> SimpleNamespace:
-    cfg = Config(
-        N=3,
-        DAYS=1,
-        HOURS=4,
-        MIN_SHIFT_HOURS=1,
-        MAX_SHIFT_HOURS=2,
-        REST_HOURS=0,
-        TIME_LIMIT_SEC=1.0,
-        NUM_PARALLEL_WORKERS=1,
-        LOG_SOLUTIONS_FREQUENCY_SECONDS=1.0,
-    )
-    staff = [
-        Staff(id=0, name="Ben", band=1, skills=["ANY"]),
-        Staff(id=1, name="Harry", band=2, skills=["ANY"]),
-        Staff(id=2, name="Luke", band=3, skills=["ANY"]),
-    ]
-    allowed = [[True for _ in range(cfg.HOURS)] for _ in range(cfg.N)]
-    data = InputData(staff=staff, cfg=cfg, allowed=allowed)
-
-    model = cp_model.CpModel()
-    x = {
-        (e, d, h): model.NewBoolVar(f"x_{e}_{d}_{h}")
-        for e in range(cfg.N)
-        for d in range(cfg.DAYS)
-        for h in range(cfg.HOURS)
-    }
-
-    return SimpleNamespace(cfg=cfg, data=data, m=model, x=x)
+from rostering.rules.fairness import FairnessRule, _required_hours_lower_bound
 
 
-def test_fairness_adds_band_penalties_for_high_band_staff():
-    ctx = _make_ctx()
+def test_fairness_adds_band_penalties_for_high_band_staff(fairness_ctx):
+    ctx = fairness_ctx
     rule = FairnessRule(
         ctx,
         base=1.2,
@@ -58,3 +22,75 @@ def test_fairness_adds_band_penalties_for_high_band_staff():
     base_terms = ctx.cfg.N * 2
     # Threshold is inclusive, so all three bands receive an extra penalty term.
     assert len(terms) == base_terms + ctx.cfg.N
+
+
+def test_fairness_skips_band_cap_when_horizon_fits_max_gap(fairness_ctx):
+    ctx = fairness_ctx  # horizon_ub = DAYS * HOURS = 4
+    rule = FairnessRule(ctx, max_deviation_hours=2, band_shortfall_max_gap=4)
+    rule.contribute_objective()
+    proto = ctx.m.Proto()
+    names = [v.name for v in proto.variables]
+    # AddMinEquality is stored as lin_max over negated terms; name its target.
+    min_targets = {
+        names[ct.lin_max.target.vars[0]]
+        for ct in proto.constraints
+        if ct.WhichOneof("constraint") == "lin_max"
+    }
+    assert any(n.startswith("band_shortfall_e") for n in names)
+    assert not any(n.startswith("band_cap_e") for n in names)
+    # The deviation caps still clamp, but nothing clamps a band shortfall.
+    assert min_targets
+    assert not any(n.startswith("band") for n in min_targets)
+
+
+def test_fairness_band_members_respects_threshold(fairness_ctx):
+    ctx = fairness_ctx
+    rule = FairnessRule(ctx, band_shortfall_threshold=2)
+    assert rule.bands().tolist() == [1, 2, 3]
+    assert rule.band_members().tolist() == [1, 2]
+    assert rule.band_members() is rule.band_members()
+
+
+def test_required_hours_lower_bound_takes_largest_skill_per_slot():
+    cfg = SimpleNamespace(
+        DAYS=2,
+        HOURS=2,
+        SKILL_MIN=[[{"A": 2, "B": 3}, {}], [{"A": 1}, {"B": 4}]],
+    )
+    assert _required_hours_lower_bound(cfg) == 3 + 0 + 1 + 4
+
+
+def test_fairness_linear_tiers_skip_element_constraints(fairness_ctx):
+    ctx = fairness_ctx
+    # round(1.0 * 1.01**k) == 1 for every tier, so the table is 0, 1, 2, ...
+    rule = FairnessRule(ctx, base=1.01, scale=1.0, max_deviation_hours=3)
+    terms = rule.contribute_objective()
+    assert len(terms) == ctx.cfg.N * 2 + len(rule.band_members())
+    assert not any(
+        ct.WhichOneof("constraint") == "element" for ct in ctx.m.Proto().constraints
+    )
+
+
+def test_fairness_asymmetric_posts_only_over_hours_bound(
+    rule_ctx_factory, fairness_inputs
+):
+    def n_linear(**settings) -> int:
+        ctx = rule_ctx_factory(fairness_inputs)
+        FairnessRule(ctx, **settings).contribute_objective()
+        return sum(
+            ct.WhichOneof("constraint") == "linear" for ct in ctx.m.Proto().constraints
+        )
+
+    assert n_linear(asymmetric=True) == n_linear() - 3
+
+
+def test_fairness_zero_scale_skips_tier_and_band_vars(fairness_ctx):
+    ctx = fairness_ctx
+    rule = FairnessRule(
+        ctx, scale=0.0, band_shortfall_base=1.1, band_shortfall_scale=0.3
+    )
+    terms = rule.contribute_objective()
+    # Band tiers all round to 0, so only the linear dev term per employee remains.
+    assert len(terms) == ctx.cfg.N
+    names = {v.name for v in ctx.m.Proto().variables}
+    assert not any(n.startswith(("dev_cap_e", "band_shortfall_e")) for n in names)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from rostering.config import Config
 from rostering.rules.fairness import FairnessRule
 from rostering.rules.registry import default_rule_specs, normalize_rule_specs
+from rostering.rules.rest import RestRule
+from rostering.rules.weekly_cap import WeeklyCapRule
 
 
 def test_normalize_rule_specs_accepts_classes():
@@ -16,3 +19,17 @@ def test_default_rule_specs_returns_fresh_instances():
     assert first[0].cls is second[0].cls
     first[0].settings["demo"] = "x"
     assert "demo" not in second[0].settings
+
+
+def test_rules_disabled_by_config_report_is_enabled_false():
+    cfg = Config(N=1, REST_HOURS=0, WEEKLY_MAX_HOURS=None)
+    assert not RestRule.is_enabled(cfg)
+    assert not WeeklyCapRule.is_enabled(cfg)
+    assert FairnessRule.is_enabled(cfg)
+
+
+def test_normalize_rule_specs_returns_copy_of_canonical_list():
+    specs = default_rule_specs()
+    normalized = normalize_rule_specs(specs)
+    assert normalized == specs
+    assert normalized is not specs
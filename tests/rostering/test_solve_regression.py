@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from rostering.config import Config
+from rostering.input_data import InputData
+from rostering.main import run_solver
+from rostering.staff import Staff
+
+START = datetime(2024, 1, 1)
+
+
+def _small_instance(enable_unsat_core: bool) -> tuple[Config, InputData]:
+    """
+    Two employees over two 6-hour days. Employee 1 is off on day 1 and may not
+    work hour 0, so shift intervals, coverage, availability and the weekly cap
+    all shape the optimum.
+    """
+    cfg = Config(
+        N=2,
+        DAYS=2,
+        HOURS=6,
+        START_DATE=START,
+        MIN_SHIFT_HOURS=2,
+        MAX_SHIFT_HOURS=4,
+        REST_HOURS=0,
+        WEEKLY_MAX_HOURS=6,
+        TIME_LIMIT_SEC=10.0,
+        NUM_PARALLEL_WORKERS=1,
+        LOG_SOLUTIONS_FREQUENCY_SECONDS=1.0,
+        ENABLE_UNSAT_CORE=enable_unsat_core,
+        DEFAULT_MIN_STAFF=0,
+    )
+    assert cfg.SKILL_MIN is not None  # filled in by Config.__post_init__
+    skill_min = cfg.SKILL_MIN
+    for d in range(cfg.DAYS):
+        for h in range(1, 4):
+            skill_min[d][h]["ANY"] = 1
+    skill_min[0][0]["ANY"] = 1
+
+    staff = [
+        Staff(
+            id=e,
+            name=f"S{e}",
+            band=e + 1,
+            skills=["ANY"],
+            is_night_worker=False,
+            max_consec_days=None,
+            holidays={(START + timedelta(days=1)).date()} if e == 1 else set(),
+        )
+        for e in range(cfg.N)
+    ]
+    allowed = [[True] * cfg.HOURS, [False] + [True] * (cfg.HOURS - 1)]
+    return cfg, InputData(staff=staff, cfg=cfg, allowed=allowed)
+
+
+@pytest.mark.parametrize("enable_unsat_core", [False, True])
+def test_small_instance_status_and_objective(enable_unsat_core, tmp_path, monkeypatch):
+    # A feasible solve writes CSVs and a Gantt chart under ./outputs.
+    monkeypatch.chdir(tmp_path)
+    cfg, data = _small_instance(enable_unsat_core)
+
+    res = run_solver(cfg, data=data, enable_reporting=False)
+
+    assert res.status_name == "OPTIMAL"
+    assert res.objective_value == pytest.approx(10.0)
@@ -47,3 +47,38 @@ def test_max_consecutive_days_rule_enforces_employee_cap():
     assert any(
         key.startswith("MAX-CONSEC") for key in res.unsat_core_groups
     ), f"Unexpected UNSAT groups: {res.unsat_core_groups}"
+
+
+def test_holiday_conflict_reports_availability_in_unsat_core():
+    cfg = Config(
+        N=1,
+        DAYS=2,
+        HOURS=4,
+        START_DATE=datetime(2024, 1, 1),
+        MIN_SHIFT_HOURS=1,
+        MAX_SHIFT_HOURS=2,
+        REST_HOURS=0,
+        WEEKLY_MAX_HOURS=None,
+        TIME_LIMIT_SEC=2.0,
+        NUM_PARALLEL_WORKERS=1,
+        LOG_SOLUTIONS_FREQUENCY_SECONDS=1.0,
+        DEFAULT_MIN_STAFF=0,
+    )
+    cfg.SKILL_MIN[1][1]["ANY"] = 1  # demand on the only employee's holiday
+
+    staff = [
+        Staff(
+            id=0,
+            name="Only",
+            band=1,
+            skills=["ANY"],
+            is_night_worker=False,
+            max_consec_days=None,
+            holidays={datetime(2024, 1, 2).date()},
+        )
+    ]
+    data = InputData(staff=staff, cfg=cfg, allowed=[[True] * cfg.HOURS])
+
+    res = run_solver(cfg, data=data, enable_reporting=False)
+    assert res.status_name == "INFEASIBLE"
+    assert "AVAIL" in res.unsat_core_groups, res.unsat_core_groups
@@ -49,3 +49,15 @@ def test_staff_raises_on_invalid_dates() -> None:
             skills=["ANY"],
             holidays={"not-a-date"},  # type: ignore[arg-type]
         )
+
+
+def test_staff_coerces_band_and_consecutive_cap_to_int() -> None:
+    staffer = Staff(
+        id=5,
+        name="Numeric",
+        band="2",  # type: ignore[arg-type]
+        skills=["ANY"],
+        max_consec_days=3.0,  # type: ignore[arg-type]
+    )
+    assert staffer.band == 2
+    assert staffer.max_consec_days == 3
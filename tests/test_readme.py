@@ -7,7 +7,6 @@ exist in the expected location.
 from pathlib import Path
 
 
-def test_readme_exists(project_root: Path) -> None:
+def test_readme_exists(readme_path: Path) -> None:
     """Ensure that a README file exists at the project root."""
-    readme = project_root / "README.md"
-    assert readme.exists(), "README.md should exist at the project root"
+    assert readme_path.is_file(), "README.md should exist at the project root"